@@ -1,8 +1,6 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 import logging
-import time
-import threading
 from datetime import datetime
 
 # 설정 및 DB 임포트
@@ -70,6 +68,7 @@ def create_app():
                 'database': db_status,
                 'stock_service': 'running' if stock_service.is_running else 'stopped'
             },
+            'stock_stats': stock_service.get_stats(),
             'timestamp': datetime.utcnow().isoformat()
         })
     
@@ -98,16 +97,30 @@ def create_app():
             MarketService.initialize_default_markets()
             logging.info("시장 운영 시간 데이터 초기화 완료")
             
-            # 자동 업데이트 시작 (5분 간격)
-            stock_service.start_auto_update(Config.STOCK_UPDATE_INTERVAL)
+            # 상장 종목 마스터를 DB에서 메모리로 적재
+            from services.listing_service import listing_service
+            listing_service.load()
             
-            # 백그라운드에서 초기 데이터 로드 (비동기)
-            def load_initial_data():
-                time.sleep(10)  # 10초 후에 시작
-                stock_service.update_stock_cache()
+            # 별도 수집 프로세스(python -m services.ingest)를 쓰면 웹 앱은 읽기만 함
+            if not Config.IN_APP_STOCK_UPDATE:
+                stock_service.enable_read_only()
             
-            init_thread = threading.Thread(target=load_initial_data, daemon=True)
-            init_thread.start()
+            # 멀티 프로세스 모드: writer 1개만 갱신하고 나머지 워커는 공유 보드를 읽음
+            is_reader = False
+            if Config.SHARED_QUOTE_BOARD_NAME:
+                is_reader = Config.SHARED_QUOTE_BOARD_ROLE != 'writer' or not Config.IN_APP_STOCK_UPDATE
+                stock_service.attach_shared_board(Config.SHARED_QUOTE_BOARD_NAME, writer=not is_reader)
+            
+            if not is_reader:
+                # DB에 저장된 시세로 메모리 캐시 웜스타트 (쿼리 1회)
+                stock_service.warm_start()
+                
+                # 여러 프로세스/노드가 있으면 리더 1개만 제공자를 호출해 갱신
+                if Config.UPDATER_LEADER_ELECTION and Config.IN_APP_STOCK_UPDATE:
+                    stock_service.enable_leader_election(Config.UPDATER_LEADER_ELECTION)
+                
+                # 자동 업데이트 시작 (5분 간격, 첫 주기는 오래된 종목만 조회 / 읽기 전용이면 DB 동기화만)
+                stock_service.start_auto_update(Config.STOCK_UPDATE_INTERVAL)
             
             logging.info("서비스 초기화 완료")
             
@@ -1,13 +1,12 @@
 from flask import Flask, jsonify, send_from_directory
 from flask_cors import CORS
 import logging
-import time
-import threading
 from datetime import datetime
 import os
 
-# 설정 및 서비스 임포트
+# 설정, DB 및 서비스 임포트
 from config import Config
+from utils.db import init_db
 from services.stock_service import stock_service
 
 # 라우트 임포트
@@ -35,6 +34,13 @@ def create_app():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    # MySQL 데이터베이스 초기화
+    init_db(app)
+    logging.info("MySQL 데이터베이스 연결 완료")
+    
+    # Stock Service에 앱 참조 전달 (웜스타트/DB 저장에 사용)
+    stock_service.init_app(app)
+    
     # API 라우트 등록
     app.register_blueprint(auth_bp, url_prefix='/api')
     app.register_blueprint(stocks_bp, url_prefix='/api')
@@ -84,16 +90,30 @@ def create_app():
         try:
             logging.info("서비스 초기화 시작...")
             
-            # 자동 업데이트 시작 (5분 간격)
-            stock_service.start_auto_update(Config.STOCK_UPDATE_INTERVAL)
+            # 상장 종목 마스터를 DB에서 메모리로 적재
+            from services.listing_service import listing_service
+            listing_service.load()
+            
+            # 별도 수집 프로세스(python -m services.ingest)를 쓰면 웹 앱은 읽기만 함
+            if not Config.IN_APP_STOCK_UPDATE:
+                stock_service.enable_read_only()
             
-            # 백그라운드에서 초기 데이터 로드
-            def load_initial_data():
-                time.sleep(10)
-                stock_service.update_stock_cache()
+            # 멀티 프로세스 모드: writer 1개만 갱신하고 나머지 워커는 공유 보드를 읽음
+            is_reader = False
+            if Config.SHARED_QUOTE_BOARD_NAME:
+                is_reader = Config.SHARED_QUOTE_BOARD_ROLE != 'writer' or not Config.IN_APP_STOCK_UPDATE
+                stock_service.attach_shared_board(Config.SHARED_QUOTE_BOARD_NAME, writer=not is_reader)
             
-            init_thread = threading.Thread(target=load_initial_data, daemon=True)
-            init_thread.start()
+            if not is_reader:
+                # DB에 저장된 시세로 메모리 캐시 웜스타트 (쿼리 1회)
+                stock_service.warm_start()
+                
+                # 여러 프로세스가 있으면 리더 1개만 제공자를 호출해 갱신
+                if Config.UPDATER_LEADER_ELECTION and Config.IN_APP_STOCK_UPDATE:
+                    stock_service.enable_leader_election(Config.UPDATER_LEADER_ELECTION)
+                
+                # 자동 업데이트 시작 (5분 간격, 첫 주기는 오래된 종목만 조회 / 읽기 전용이면 DB 동기화만)
+                stock_service.start_auto_update(Config.STOCK_UPDATE_INTERVAL)
             
             logging.info("서비스 초기화 완료")
             
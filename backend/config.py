@@ -34,7 +34,92 @@ class Config:
     
     # 주식 데이터 업데이트 간격 (초)
     STOCK_UPDATE_INTERVAL = 300  # 5분마다 업데이트 (rate limiting 방지)
-    
+    UPDATER_STOP_TIMEOUT = float(os.getenv("UPDATER_STOP_TIMEOUT", 10))  # 종료 시 갱신 스레드를 기다리는 최대 시간(초)
+    # 웹 앱 안에서 시세를 수집할지 여부 (false: 별도 수집 프로세스 `python -m services.ingest` 사용)
+    IN_APP_STOCK_UPDATE = os.getenv("IN_APP_STOCK_UPDATE", "true").lower() == "true"
+    MARKET_DATA_TTL = int(os.getenv("MARKET_DATA_TTL", 60))  # 환율/지수 메모리 캐시 시간(초)
+
+    # 시세 갱신 엔진 설정
+    STOCK_UPDATE_WORKERS = int(os.getenv("STOCK_UPDATE_WORKERS", 8))  # 동시 조회 스레드 수
+    STOCK_UPDATE_SYMBOLS_PER_MARKET = int(os.getenv("STOCK_UPDATE_SYMBOLS_PER_MARKET", 10))  # 시장별 자동 갱신 종목 수
+
+    # 종목별 적응형 갱신 스케줄러 (점수 = 보유자 수 + 최근 조회 빈도 + 변동성, 주기 = 기본 주기 / (1 + 점수))
+    REFRESH_SCHEDULER = {
+        'tick': 10,                # 갱신 시각이 된 종목을 확인하는 주기(초)
+        'min_interval': 30,        # 가장 자주 갱신하는 종목의 주기(초), 기본 주기는 STOCK_UPDATE_INTERVAL
+        'view_half_life': 600,     # 조회수 감쇠 반감기(초)
+        'holder_weight': 1.0,
+        'view_weight': 1.0,
+        'volatility_weight': 0.5,  # 갱신 간 변동률(%) 가중치
+    }
+    VIEW_FLUSH_INTERVAL = int(os.getenv("VIEW_FLUSH_INTERVAL", 30))  # 조회수를 DB에 모아 누적/갱신 프로세스가 병합하는 주기(초)
+    MARKET_SETTLE_DELAY = int(os.getenv("MARKET_SETTLE_DELAY", 600))  # 장 마감 후 종가 확정 조회까지 대기(초)
+    MARKET_CALENDAR_REFRESH = int(os.getenv("MARKET_CALENDAR_REFRESH", 300))  # 시장 운영 시간 변경 확인 주기(초)
+
+    # 상장 종목 마스터 (KRX/KOSDAQ/NASDAQ/NYSE) 전체 갱신 주기(초)
+    LISTING_REFRESH_INTERVAL = int(os.getenv("LISTING_REFRESH_INTERVAL", 86400))
+
+    # 데이터 제공자별 요청 속도 제한 (초당 요청 수, 버스트 크기)
+    PROVIDER_RATE_LIMITS = {
+        'KRW': {'rate': float(os.getenv("KR_PROVIDER_RATE", 2.0)), 'burst': 4},   # KRX (FinanceDataReader)
+        'USD': {'rate': float(os.getenv("US_PROVIDER_RATE", 1.0)), 'burst': 2},   # 미국 (FDR/yfinance)
+    }
+
+    # 메모리 시세 보드 초기 슬롯 수 (부족하면 자동으로 늘어남)
+    QUOTE_BOARD_CAPACITY = int(os.getenv("QUOTE_BOARD_CAPACITY", 5000))
+
+    # 프로세스 간 공유 시세 보드 (이름을 지정하면 멀티 프로세스 모드)
+    SHARED_QUOTE_BOARD_NAME = os.getenv("SHARED_QUOTE_BOARD_NAME", "")
+    SHARED_QUOTE_BOARD_ROLE = os.getenv("SHARED_QUOTE_BOARD_ROLE", "reader")  # writer: 갱신을 담당하는 프로세스 1개
+
+    # 갱신 리더 선출 (db: updater_leases 테이블 lease, file: 단일 호스트 파일 잠금, 빈 값: 사용 안 함)
+    UPDATER_LEADER_ELECTION = os.getenv("UPDATER_LEADER_ELECTION", "")
+    UPDATER_LEASE_SECONDS = int(os.getenv("UPDATER_LEASE_SECONDS", 30))  # 리더가 heartbeat 없이 유지되는 최대 시간
+    UPDATER_LOCK_FILE = os.getenv("UPDATER_LOCK_FILE", "/tmp/stock_updater.lock")
+
+    # 자동 갱신 대상 외 종목용 조회 캐시 (LRU + TTL)
+    QUOTE_CACHE_MAX_ENTRIES = int(os.getenv("QUOTE_CACHE_MAX_ENTRIES", 5000))
+    QUOTE_CACHE_TTL = int(os.getenv("QUOTE_CACHE_TTL", 60))  # 초
+
+    # 존재하지 않는(상장폐지 포함) 종목 네거티브 캐시
+    NEGATIVE_CACHE_MAX_ENTRIES = int(os.getenv("NEGATIVE_CACHE_MAX_ENTRIES", 10000))
+    NEGATIVE_CACHE_TTL = int(os.getenv("NEGATIVE_CACHE_TTL", 6 * 3600))  # 초
+
+    # stale-while-revalidate 조회 설정
+    QUOTE_SOFT_TTL = int(os.getenv("QUOTE_SOFT_TTL", 60))  # 이 시간(초)이 지난 시세는 백그라운드 갱신
+    # 갱신 프로세스가 갱신 중인 종목으로 볼 시세 나이 상한(초) - 이보다 오래되면 워커가 직접 갱신
+    UPDATER_REFRESH_HORIZON = int(os.getenv("UPDATER_REFRESH_HORIZON", STOCK_UPDATE_INTERVAL * 2))
+    QUOTE_FETCH_DEADLINE = float(os.getenv("QUOTE_FETCH_DEADLINE", 3.0))  # 캐시에 값이 없을 때 최대 대기(초)
+    QUOTE_REVALIDATE_WORKERS = int(os.getenv("QUOTE_REVALIDATE_WORKERS", 4))
+
+    # 시세 증분 조회: 마지막 봉이 없을 때 받는 기간(일, 연휴를 포함해 거래일 2개 이상)
+    QUOTE_INITIAL_DAYS = int(os.getenv("QUOTE_INITIAL_DAYS", 14))
+
+    # 일봉 로컬 저장소 (종목별 .npy, 비워두면 차트 조회마다 제공자에서 전체 구간 조회)
+    BAR_STORE_DIR = os.getenv("BAR_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "bars"))
+    BAR_STORE_REFRESH = int(os.getenv("BAR_STORE_REFRESH", 900))  # 최근 봉을 다시 확인하는 간격(초)
+    BAR_STORE_HISTORY_DAYS = int(os.getenv("BAR_STORE_HISTORY_DAYS", 1100))  # 처음 저장할 때 받는 기간(일)
+
+    # 차트 응답 캐시 (새 일봉이 저장되면 무효화, TTL은 오래 쓰지 않는 항목 정리용)
+    # 응답 1건이 수년치 봉 전체(json 봉당 약 0.5KB, 3년 일봉이면 약 350KB)이므로 바이트 기준으로 제한
+    HISTORY_CACHE_MAX_BYTES = int(os.getenv("HISTORY_CACHE_MAX_BYTES", 64 * 1024 * 1024))  # 워커당
+    HISTORY_CACHE_MAX_ENTRIES = int(os.getenv("HISTORY_CACHE_MAX_ENTRIES", 500))
+    HISTORY_CACHE_TTL = int(os.getenv("HISTORY_CACHE_TTL", 24 * 3600))
+
+    # 종목 검색 시세 첨부 (none: 종목 정보만, cached: 캐시된 시세만, fetch: 없는 시세는 제한 시간 내 병렬 조회)
+    SEARCH_QUOTE_MODE = os.getenv("SEARCH_QUOTE_MODE", "fetch")
+    SEARCH_QUOTE_DEADLINE = float(os.getenv("SEARCH_QUOTE_DEADLINE", 1.0))  # 검색 시 시세 조회 최대 대기(초)
+    MULTIPLE_QUOTE_DEADLINE = float(os.getenv("MULTIPLE_QUOTE_DEADLINE", 3.0))  # 다중 조회 시 시세 조회 최대 대기(초)
+
+    # 데이터 제공자별 서킷 브레이커 설정
+    CIRCUIT_BREAKER = {
+        'failure_rate': 0.5,   # 최근 호출 중 실패 비율이 이 이상이면 차단
+        'window': 20,          # 실패율 계산에 쓰는 최근 호출 수
+        'min_calls': 5,        # 차단 판단을 위한 최소 호출 수
+        'open_seconds': 30,    # 차단 유지 시간 (이후 half-open 시험 호출)
+        'half_open_calls': 1,  # half-open 상태에서 허용하는 시험 호출 수
+    }
+
     # Flask 설정
     DEBUG = os.getenv("FLASK_DEBUG", "True").lower() == "true"
     TESTING = False
@@ -1,6 +1,9 @@
 from models.user import User, UserModel
 from models.portfolio import PortfolioItem, Transaction, Portfolio
-from models.stock import MarketHours, Stock, StockCache
+from models.stock import MarketHours, Stock, StockCache, MarketSnapshot
+from models.listing import StockListing
+from models.lease import UpdaterLease
+from models.view import SymbolView
 
 __all__ = [
     'User',
@@ -10,5 +13,9 @@ __all__ = [
     'Portfolio',
     'MarketHours',
     'Stock',
-    'StockCache'  # 하위 호환성을 위한 별칭
+    'StockCache',  # 하위 호환성을 위한 별칭
+    'MarketSnapshot',
+    'StockListing',
+    'UpdaterLease',
+    'SymbolView'
 ]
@@ -0,0 +1,19 @@
+from utils.db import db
+from datetime import datetime
+
+class UpdaterLease(db.Model):
+    """백그라운드 갱신 리더 임대(lease) 모델"""
+    __tablename__ = 'updater_leases'
+
+    name = db.Column(db.String(50), primary_key=True)
+    owner = db.Column(db.String(100), nullable=False)
+    heartbeat_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'owner': self.owner,
+            'heartbeat_at': self.heartbeat_at,
+            'expires_at': self.expires_at
+        }
@@ -0,0 +1,58 @@
+from utils.db import db, upsert_rows
+from datetime import datetime
+
+class StockListing(db.Model):
+    """상장 종목 마스터 (KRX/KOSDAQ/NASDAQ/NYSE 전 종목)"""
+    __tablename__ = 'stock_listings'
+
+    symbol = db.Column(db.String(20), primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    exchange = db.Column(db.String(20), nullable=False)  # KOSPI, KOSDAQ, KONEX, NASDAQ, NYSE
+    market = db.Column(db.String(10), nullable=False)    # KRW / USD (시세 시장 구분)
+    currency = db.Column(db.String(10), nullable=False)
+    sector = db.Column(db.String(100))
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_listings_exchange', 'exchange'),
+        db.Index('idx_listings_updated_at', 'updated_at'),
+    )
+
+    UPDATE_COLUMNS = ('name', 'exchange', 'market', 'currency', 'sector', 'updated_at')
+
+    def to_dict(self):
+        return {
+            'symbol': self.symbol,
+            'name': self.name,
+            'exchange': self.exchange,
+            'market': self.market,
+            'currency': self.currency,
+            'sector': self.sector
+        }
+
+    @classmethod
+    def bulk_upsert(cls, rows, chunk_size=1000):
+        """종목 마스터 일괄 저장 (rows: to_dict 형식 + updated_at)"""
+        if not rows:
+            return 0
+
+        if not upsert_rows(cls.__table__, rows, cls.UPDATE_COLUMNS, chunk_size=chunk_size):
+            # 지원하지 않는 DB는 행 단위 merge
+            try:
+                for row in rows:
+                    db.session.merge(cls(**row))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+        return len(rows)
+
+    @classmethod
+    def delete_missing(cls, exchanges, refreshed_before):
+        """이번 갱신에 포함되지 않은(상장폐지) 종목 삭제"""
+        deleted = cls.query.filter(
+            cls.exchange.in_(exchanges),
+            cls.updated_at < refreshed_before
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
@@ -86,6 +86,17 @@ class Portfolio:
         items = PortfolioItem.query.filter_by(user_id=user_id).filter(PortfolioItem.quantity > 0).all()
         return [item.to_dict() for item in items]
     
+    @staticmethod
+    def count_holders():
+        """종목별 보유자 수 {symbol: count}"""
+        from models.stock import Stock
+        
+        rows = db.session.query(Stock.symbol, db.func.count(PortfolioItem.user_id)) \
+            .join(PortfolioItem, PortfolioItem.stock_id == Stock.stock_id) \
+            .filter(PortfolioItem.quantity > 0) \
+            .group_by(Stock.symbol).all()
+        return {symbol: count for symbol, count in rows}
+    
     @staticmethod
     def get_portfolio_items(user_id):
         """사용자 포트폴리오 조회 (별칭)"""
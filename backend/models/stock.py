@@ -1,5 +1,6 @@
-from utils.db import db
+from utils.db import db, upsert_rows
 from datetime import datetime
+import json
 
 class MarketHours(db.Model):
     """시장 운영 시간 모델"""
@@ -125,6 +126,74 @@ class Stock(db.Model):
         db.session.commit()
         return stock
 
+    
+    # bulk_upsert에서 갱신하는 컬럼 (symbol 제외)
+    BULK_UPDATE_COLUMNS = (
+        'name', 'current_price', 'previous_close', 'open_price', 'high_price',
+        'low_price', 'volume', 'change_amount', 'change_percent', 'market',
+        'currency', 'exchange_rate', 'updated_at'
+    )
+    
+    @staticmethod
+    def _bulk_row(symbol, data):
+        """시세 dict를 stocks 테이블 행으로 변환"""
+        return {
+            'symbol': symbol,
+            'name': data.get('name', symbol),
+            'current_price': data.get('current_price', 0),
+            'previous_close': data.get('previous_close'),
+            'open_price': data.get('open_price'),
+            'high_price': data.get('high_price'),
+            'low_price': data.get('low_price'),
+            'volume': data.get('volume', 0),
+            'change_amount': data.get('change'),
+            'change_percent': data.get('change_percent'),
+            'market': data.get('market', 'KRW'),
+            'currency': data.get('currency', 'KRW'),
+            'exchange_rate': data.get('exchange_rate', 1.0),
+            'updated_at': data.get('updated_at') or datetime.utcnow()
+        }
+    
+    @classmethod
+    def bulk_upsert(cls, quotes, chunk_size=500):
+        """여러 종목 시세를 한 트랜잭션으로 일괄 저장 (quotes: {symbol: 시세 dict})"""
+        rows = [cls._bulk_row(symbol, data) for symbol, data in quotes.items()]
+        if not rows:
+            return 0
+        
+        if not upsert_rows(cls.__table__, rows, cls.BULK_UPDATE_COLUMNS, chunk_size=chunk_size):
+            # 지원하지 않는 DB는 행 단위 upsert로 처리
+            for row in rows:
+                cls.upsert(row['symbol'], quotes[row['symbol']])
+        return len(rows)
+
+
+class MarketSnapshot(db.Model):
+    """환율/지수 등 시장 데이터 스냅샷 (수집 프로세스가 저장하고 웹 워커가 읽음)"""
+    __tablename__ = 'market_snapshots'
+    
+    key = db.Column(db.String(50), primary_key=True)
+    payload = db.Column(db.Text, nullable=False)  # JSON
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @classmethod
+    def save(cls, key, payload):
+        """스냅샷 저장 (있으면 덮어씀)"""
+        snapshot = db.session.get(cls, key)
+        if not snapshot:
+            snapshot = cls(key=key)
+            db.session.add(snapshot)
+        snapshot.payload = json.dumps(payload, ensure_ascii=False)
+        snapshot.updated_at = datetime.utcnow()
+        db.session.commit()
+        return snapshot
+    
+    @classmethod
+    def load(cls, key):
+        """스냅샷 값 조회 (없으면 None)"""
+        snapshot = db.session.get(cls, key)
+        return json.loads(snapshot.payload) if snapshot else None
+
 
 # 하위 호환성을 위한 별칭
 StockCache = Stock
@@ -0,0 +1,49 @@
+from utils.db import db, upsert_rows
+from datetime import datetime
+
+class SymbolView(db.Model):
+    """종목별 누적 조회수 (웹 워커가 모아서 더하고, 갱신 프로세스가 읽어 갱신 우선순위에 반영)"""
+    __tablename__ = 'symbol_views'
+
+    symbol = db.Column(db.String(20), primary_key=True)
+    views = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_symbol_views_updated_at', 'updated_at'),
+    )
+
+    @classmethod
+    def add_views(cls, counts):
+        """조회수 일괄 누적 ({symbol: 증가분}, views = views + 증가분)
+
+        여러 워커가 동시에 써도 잠금 순서가 같도록 종목 순으로 정렬해서 저장
+        """
+        if not counts:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [{'symbol': symbol, 'views': count, 'updated_at': now} for symbol, count in sorted(counts.items())]
+        increment = lambda new: {'views': cls.__table__.c.views + new.views, 'updated_at': new.updated_at}
+        if not upsert_rows(cls.__table__, rows, increment):
+            # 지원하지 않는 DB는 행 단위 갱신
+            try:
+                for row in rows:
+                    updated = cls.query.filter_by(symbol=row['symbol']).update(
+                        {cls.views: cls.views + row['views'], cls.updated_at: now}, synchronize_session=False
+                    )
+                    if not updated:
+                        db.session.add(cls(**row))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+        return len(rows)
+
+    @classmethod
+    def load_totals(cls, since=None):
+        """누적 조회수 {symbol: views} (since를 주면 그 이후 바뀐 종목만)"""
+        query = db.session.query(cls.symbol, cls.views)
+        if since is not None:
+            query = query.filter(cls.updated_at >= since)
+        return {symbol: views for symbol, views in query}
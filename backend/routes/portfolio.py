@@ -59,9 +59,7 @@ def get_portfolio():
             symbol = holding['symbol']
             
             # 상세 주식 정보 조회 (환율 포함)
-            stock_data = stock_service.get_cached_stock_data(symbol)
-            if not stock_data:
-                stock_data = stock_service.get_stock_info(symbol)
+            stock_data, _ = stock_service.get_quote(symbol)
             
             if stock_data:
                 current_price = stock_data['current_price']
@@ -138,13 +136,14 @@ def buy_stock():
             return jsonify({'error': '수량은 0보다 커야 합니다.'}), 400
         
         # 현재 주식 가격 조회 - 상세 정보 포함
-        stock_data = stock_service.get_cached_stock_data(symbol)
-        if not stock_data:
-            stock_data = stock_service.get_stock_info(symbol)
+        stock_data, _ = stock_service.get_quote(symbol)
         
         if not stock_data:
             return jsonify({'error': '주식 정보를 찾을 수 없습니다.'}), 404
         
+        # 거래/매수 가능 조회도 갱신 우선순위에 반영 (갱신 프로세스의 스케줄에 포함되도록)
+        stock_service.record_view(symbol)
+        
         current_price = stock_data['current_price']
         
         # 시장 구분 및 환율 적용
@@ -260,13 +259,14 @@ def sell_stock():
             return jsonify({'error': '보유 수량이 부족합니다.'}), 400
         
         # 현재 주식 가격 조회 - 상세 정보 포함
-        stock_data = stock_service.get_cached_stock_data(symbol)
-        if not stock_data:
-            stock_data = stock_service.get_stock_info(symbol)
+        stock_data, _ = stock_service.get_quote(symbol)
         
         if not stock_data:
             return jsonify({'error': '주식 정보를 찾을 수 없습니다.'}), 404
         
+        # 거래/매수 가능 조회도 갱신 우선순위에 반영 (갱신 프로세스의 스케줄에 포함되도록)
+        stock_service.record_view(symbol)
+        
         current_price = stock_data['current_price']
         market = holding['market']
         
@@ -355,13 +355,14 @@ def calculate_max_buy(symbol):
             return jsonify({'error': error}), 401
         
         # 현재 주식 가격 조회 - 상세 정보 포함
-        stock_data = stock_service.get_cached_stock_data(symbol)
-        if not stock_data:
-            stock_data = stock_service.get_stock_info(symbol)
+        stock_data, _ = stock_service.get_quote(symbol)
         
         if not stock_data:
             return jsonify({'error': '주식 정보를 찾을 수 없습니다.'}), 404
         
+        # 거래/매수 가능 조회도 갱신 우선순위에 반영 (갱신 프로세스의 스케줄에 포함되도록)
+        stock_service.record_view(symbol)
+        
         current_price = stock_data['current_price']
         market = stock_data.get('currency', 'KRW')
         
@@ -453,26 +454,8 @@ def get_portfolio_summary():
         # 포트폴리오 조회
         holdings = portfolio_model.get_user_portfolio(user_id)
         
-        # 현재 가격 정보로 계산 (환율 적용)
-        current_prices = {}
-        for holding in holdings:
-            symbol = holding['symbol']
-            
-            # 상세 주식 정보 조회 (환율 포함)
-            stock_data = stock_service.get_cached_stock_data(symbol)
-            if not stock_data:
-                stock_data = stock_service.get_stock_info(symbol)
-            
-            if stock_data:
-                current_price = stock_data['current_price']
-                
-                # 미국 주식인 경우 환율 적용
-                if stock_data.get('currency') == 'USD' and stock_data.get('exchange_rate'):
-                    current_price_krw = current_price * stock_data['exchange_rate']
-                else:
-                    current_price_krw = current_price
-                
-                current_prices[symbol] = current_price_krw
+        # 현재 가격 정보로 계산 (환율 적용, 시세 보드에서 일괄 조회)
+        current_prices = stock_service.get_krw_prices(holding['symbol'] for holding in holdings)
         
         total_value = portfolio_model.calculate_portfolio_value(user_id, current_prices)
         total_profit_loss = portfolio_model.calculate_profit_loss(user_id, current_prices)
@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from services.stock_service import stock_service
 from services.auth_service import auth_service
+from utils.history_format import HISTORY_FORMATS, pack_msgpack
 import logging
 
 stocks_bp = Blueprint('stocks', __name__, url_prefix='/api/stocks')
@@ -56,7 +57,12 @@ def search_stocks():
         if len(query) < 1:
             return jsonify({'error': '검색어는 최소 1자 이상이어야 합니다.'}), 400
         
-        results = stock_service.search_stocks(query)
+        # 시세 첨부 방식 (none / cached / fetch, 기본값은 SEARCH_QUOTE_MODE)
+        quotes = request.args.get('quotes')
+        if quotes and quotes not in ('none', 'cached', 'fetch'):
+            return jsonify({'error': 'quotes는 none, cached, fetch 중 하나여야 합니다.'}), 400
+        
+        results = stock_service.search_stocks(query, quotes)
         
         return jsonify({
             'data': results
@@ -75,17 +81,18 @@ def get_stock_detail(symbol):
         if error:
             return jsonify({'error': error}), 401
         
-        # 캐시에서 먼저 조회
-        stock_data = stock_service.get_cached_stock_data(symbol)
-        if not stock_data:
-            # 캐시에 없으면 실시간 조회
-            stock_data = stock_service.get_stock_info(symbol)
+        # 마지막 시세 즉시 반환 (오래됐으면 백그라운드 갱신, 없을 때만 제한 시간 내 조회)
+        stock_data, age = stock_service.get_quote(symbol)
         
         if not stock_data:
             return jsonify({'error': '주식 정보를 찾을 수 없습니다.'}), 404
         
+        # 조회 빈도를 갱신 우선순위에 반영
+        stock_service.record_view(symbol)
+        
         return jsonify({
-            'data': stock_data
+            'data': stock_data,
+            'age_seconds': round(age, 1) if age is not None else None
         }), 200
         
     except Exception as e:
@@ -139,10 +146,16 @@ def get_multiple_stocks():
         if len(symbols) > 50:
             return jsonify({'error': '한번에 최대 50개까지만 조회 가능합니다.'}), 400
         
-        stock_data = stock_service.get_multiple_stocks(symbols)
+        if not all(isinstance(symbol, str) and symbol.strip() for symbol in symbols):
+            return jsonify({'error': '유효한 주식 심볼 목록을 입력해주세요.'}), 400
+        
+        # 캐시된 종목은 즉시, 나머지는 제한 시간 내 병렬 조회 (일부만 조회되어도 응답)
+        stock_data, statuses = stock_service.get_multiple_stocks([symbol.strip() for symbol in symbols])
         
         return jsonify({
-            'data': stock_data
+            'data': stock_data,
+            'status': statuses,
+            'partial': len(stock_data) < len(statuses)
         }), 200
         
     except Exception as e:
@@ -210,11 +223,20 @@ def get_stock_history(symbol):
         if interval not in ['daily', 'weekly', 'monthly']:
             interval = 'daily'
         
-        history_data = stock_service.get_stock_history(symbol, period_days, interval)
+        # 응답 형식 (기본 json, columnar/msgpack은 델타 인코딩 열 형식)
+        response_format = request.args.get('format', 'json')
+        if response_format not in HISTORY_FORMATS:
+            return jsonify({'error': f"format은 {', '.join(HISTORY_FORMATS)} 중 하나여야 합니다."}), 400
+        
+        fmt = 'json' if response_format == 'json' else 'columnar'
+        history_data = stock_service.get_stock_history(symbol, period_days, interval, fmt)
         
         if not history_data:
             return jsonify({'error': '주식 이력 데이터를 찾을 수 없습니다.'}), 404
         
+        if response_format == 'msgpack':
+            return Response(pack_msgpack({'data': history_data}), status=200, mimetype='application/x-msgpack')
+        
         return jsonify({
             'data': history_data
         }), 200
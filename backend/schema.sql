@@ -16,6 +16,10 @@ DROP TABLE IF EXISTS `portfolios`;
 DROP TABLE IF EXISTS `stocks`;
 DROP TABLE IF EXISTS `stock_cache`;
 DROP TABLE IF EXISTS `market_hours`;
+DROP TABLE IF EXISTS `updater_leases`;
+DROP TABLE IF EXISTS `market_snapshots`;
+DROP TABLE IF EXISTS `stock_listings`;
+DROP TABLE IF EXISTS `symbol_views`;
 DROP TABLE IF EXISTS `users`;
 
 -- ============================================
@@ -119,3 +123,51 @@ CREATE TABLE `transactions` (
     CONSTRAINT `fk_transaction_stock` FOREIGN KEY (`stock_id`) 
         REFERENCES `stocks` (`stock_id`) ON DELETE RESTRICT
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='거래내역';
+
+-- ============================================
+-- Updater_Leases: 백그라운드 갱신 리더 lease
+-- ============================================
+CREATE TABLE `updater_leases` (
+    `name` VARCHAR(50) NOT NULL COMMENT 'lease 이름',
+    `owner` VARCHAR(100) NOT NULL COMMENT '리더 프로세스 (호스트:PID:난수)',
+    `heartbeat_at` DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '마지막 heartbeat',
+    `expires_at` DATETIME NOT NULL COMMENT 'lease 만료 시각',
+    PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='갱신 리더 lease';
+
+-- ============================================
+-- Market_Snapshots: 환율/지수 스냅샷 (수집 프로세스가 저장)
+-- ============================================
+CREATE TABLE `market_snapshots` (
+    `key` VARCHAR(50) NOT NULL COMMENT '스냅샷 키 (exchange_rate, market_indices)',
+    `payload` TEXT NOT NULL COMMENT 'JSON 값',
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (`key`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='시장 데이터 스냅샷';
+
+-- ============================================
+-- Stock_Listings: 상장 종목 마스터 (하루 1회 전체 갱신)
+-- ============================================
+CREATE TABLE `stock_listings` (
+    `symbol` VARCHAR(20) NOT NULL COMMENT '종목코드',
+    `name` VARCHAR(200) NOT NULL COMMENT '종목명',
+    `exchange` VARCHAR(20) NOT NULL COMMENT '거래소 (KOSPI/KOSDAQ/KONEX/NASDAQ/NYSE)',
+    `market` VARCHAR(10) NOT NULL COMMENT '시장(KRW/USD)',
+    `currency` VARCHAR(10) NOT NULL COMMENT '통화',
+    `sector` VARCHAR(100) NULL COMMENT '업종',
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (`symbol`),
+    INDEX `idx_listings_exchange` (`exchange`),
+    INDEX `idx_listings_updated_at` (`updated_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='상장 종목 마스터';
+
+-- ============================================
+-- Symbol_Views: 종목별 누적 조회수 (웹 워커가 모아서 더함)
+-- ============================================
+CREATE TABLE `symbol_views` (
+    `symbol` VARCHAR(20) NOT NULL COMMENT '종목코드',
+    `views` BIGINT NOT NULL DEFAULT 0 COMMENT '누적 조회수',
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (`symbol`),
+    INDEX `idx_symbol_views_updated_at` (`updated_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='종목 조회수';
@@ -0,0 +1,86 @@
+"""시세 수집 전용 프로세스
+
+웹 앱과 분리된 프로세스에서 시세/환율/지수 갱신과 DB 저장을 담당한다.
+웹 앱은 IN_APP_STOCK_UPDATE=false로 실행해 저장된 값만 읽도록 한다.
+
+    cd backend
+    python -m services.ingest
+"""
+import logging
+import signal
+import threading
+
+from flask import Flask
+
+from config import Config
+from utils.db import init_db
+from services.stock_service import stock_service
+
+
+def create_ingest_app():
+    """수집 프로세스용 최소 Flask 앱 (DB 연결만 사용, 라우트 없음)"""
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    init_db(app)
+    stock_service.init_app(app)
+    return app
+
+
+def run(stop_event=None):
+    """수집 루프 실행 (stop_event가 설정될 때까지)"""
+    stop_event = stop_event or threading.Event()
+    app = create_ingest_app()
+
+    with app.app_context():
+        from services.market_service import MarketService
+        MarketService.initialize_default_markets()
+
+    # 상장 종목 마스터를 DB에서 메모리로 적재 (하루 1회 전체 갱신은 갱신 루프에서)
+    from services.listing_service import listing_service
+    listing_service.load()
+
+    # 수집 프로세스가 공유 시세 보드의 writer
+    if Config.SHARED_QUOTE_BOARD_NAME:
+        stock_service.attach_shared_board(Config.SHARED_QUOTE_BOARD_NAME, writer=True)
+
+    # 수집 프로세스를 여러 개 띄우면 리더 1개만 갱신
+    if Config.UPDATER_LEADER_ELECTION:
+        stock_service.enable_leader_election(Config.UPDATER_LEADER_ELECTION)
+
+    stock_service.warm_start()
+    stock_service.start_auto_update(Config.STOCK_UPDATE_INTERVAL)
+    logging.info("시세 수집 프로세스 시작")
+
+    try:
+        # 종료 신호를 받을 때까지 대기
+        while not stop_event.wait(1):
+            pass
+    finally:
+        logging.info("시세 수집 프로세스 종료 중...")
+        stock_service.stop_auto_update()
+        if stock_service.shared_board:
+            # 공유 보드는 웹 워커가 계속 읽을 수 있도록 삭제하지 않음
+            stock_service.shared_board.close()
+        logging.info("시세 수집 프로세스 종료 완료")
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        logging.info(f"종료 신호 수신: {signal.Signals(signum).name}")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    run(stop_event)
+
+
+if __name__ == '__main__':
+    main()
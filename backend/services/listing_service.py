@@ -0,0 +1,243 @@
+import FinanceDataReader as fdr
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from config import Config
+from utils.search_index import SearchIndex
+
+# FinanceDataReader 목록 이름 -> (시세 시장, 통화)
+LISTING_SOURCES = {
+    'KRX': ('KRW', 'KRW'),      # KOSPI / KOSDAQ / KONEX
+    'NASDAQ': ('USD', 'USD'),
+    'NYSE': ('USD', 'USD'),
+}
+
+REFRESH_RETRY_SECONDS = 3600  # 전체 목록 갱신 실패 시 재시도 간격
+RELOAD_CHECK_SECONDS = 600    # 다른 프로세스가 갱신한 목록을 다시 읽을지 확인하는 간격
+
+
+def _column(df, *names):
+    """후보 컬럼 중 존재하는 첫 번째 컬럼 이름"""
+    for name in names:
+        if name in df.columns:
+            return name
+    return None
+
+
+def _text(value):
+    if value is None or value != value:  # NaN
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+class ListingService:
+    """상장 종목 마스터 (stock_listings 테이블 + 메모리 인덱스)
+
+    수집 프로세스(리더)가 하루 한 번 전체 목록을 받아 DB에 일괄 저장하고,
+    각 프로세스는 DB에서 읽은 목록을 메모리 dict로 들고 종목명/시장 조회와 검색에 사용한다.
+    """
+
+    def __init__(self):
+        self._app = None
+        self._by_symbol = {}        # symbol -> 종목 dict (교체만 하고 수정하지 않음)
+        self._index = SearchIndex([])  # 종목코드/종목명/초성 검색 색인
+        self._seed = {}             # DB/네트워크를 쓸 수 없을 때의 기본 목록
+        self._loaded_version = None  # 메모리 목록의 DB updated_at 최댓값
+        self._last_refresh_try = 0.0
+        self._last_reload_check = 0.0
+        self._refresh_lock = threading.Lock()
+        self.is_loaded = False      # 전체 목록 적재 여부 (False면 기본 목록만 있음)
+
+    def init_app(self, app):
+        """Flask 앱 초기화"""
+        self._app = app
+
+    def seed(self, entries):
+        """기본 목록 등록 (전체 목록이 없을 때만 사용)"""
+        self._seed = {entry['symbol']: entry for entry in entries}
+        if not self.is_loaded:
+            self._by_symbol = dict(self._seed)
+            self._index = SearchIndex(self._by_symbol.values())
+
+    # ----- 외부 목록 수집 -----
+    def _fetch_source(self, source, now):
+        market, currency = LISTING_SOURCES[source]
+        if source == 'KRX':
+            # KRX-DESC에는 업종(Sector)이 포함되어 있음
+            try:
+                df = fdr.StockListing('KRX-DESC')
+            except Exception as e:
+                logging.warning(f"KRX-DESC 목록 조회 실패, KRX 목록 사용: {e}")
+                df = fdr.StockListing('KRX')
+        else:
+            df = fdr.StockListing(source)
+
+        symbol_col = _column(df, 'Code', 'Symbol')
+        name_col = _column(df, 'Name')
+        exchange_col = _column(df, 'Market')
+        sector_col = _column(df, 'Sector', 'Industry')
+        if not symbol_col or not name_col:
+            raise ValueError(f"{source} 목록 형식을 알 수 없습니다: {list(df.columns)}")
+
+        rows = []
+        for record in df.to_dict('records'):
+            symbol = _text(record.get(symbol_col))
+            name = _text(record.get(name_col))
+            if not symbol or not name:
+                continue
+            exchange = _text(record.get(exchange_col)) if exchange_col else None
+            if source != 'KRX' or not exchange:
+                exchange = source
+            elif exchange.startswith('KOSDAQ'):
+                exchange = 'KOSDAQ'  # KOSDAQ GLOBAL 포함
+            sector = _text(record.get(sector_col)) if sector_col else None
+            rows.append({
+                'symbol': symbol[:20],
+                'name': name[:200],
+                'exchange': exchange,
+                'market': market,
+                'currency': currency,
+                'sector': sector[:100] if sector else None,
+                'updated_at': now
+            })
+        return rows
+
+    def refresh(self, stop_event=None):
+        """전체 상장 목록을 받아 DB에 일괄 저장하고 메모리 목록 교체 (stop_event가 설정되면 저장 없이 중단)"""
+        with self._refresh_lock:
+            self._last_refresh_try = time.monotonic()
+            # DB(DATETIME, 초 단위)에 저장될 값과 같도록 초 미만을 버림
+            # (반올림되면 방금 저장한 종목까지 updated_at < started로 삭제될 수 있음)
+            started = datetime.utcnow().replace(microsecond=0)
+            rows, refreshed = {}, []
+            for source in LISTING_SOURCES:
+                if stop_event is not None and stop_event.is_set():
+                    logging.info("종료 요청으로 상장 목록 갱신 중단")
+                    return 0
+                try:
+                    for row in self._fetch_source(source, started):
+                        rows.setdefault(row['symbol'], row)
+                    refreshed.append(source)
+                except Exception as e:
+                    logging.error(f"{source} 상장 목록 조회 실패: {e}")
+
+            if not rows:
+                return 0
+
+            if self._app:
+                try:
+                    with self._app.app_context():
+                        from models.listing import StockListing
+                        StockListing.bulk_upsert(list(rows.values()))
+                        # 이번에 받은 거래소에서 빠진 종목은 상장폐지로 보고 삭제
+                        exchanges = {row['exchange'] for row in rows.values()}
+                        deleted = StockListing.delete_missing(exchanges, started)
+                        if deleted:
+                            logging.info(f"상장폐지 종목 {deleted}개 삭제")
+                except Exception as e:
+                    logging.error(f"상장 목록 저장 실패: {e}")
+
+            self._set_index(rows.values(), started)
+            logging.info(f"상장 목록 갱신 완료: {len(rows)}개 종목 ({', '.join(refreshed)})")
+            return len(rows)
+
+    def refresh_if_due(self, stop_event=None):
+        """마지막 갱신 후 LISTING_REFRESH_INTERVAL이 지났으면 다시 갱신"""
+        if self._last_refresh_try and time.monotonic() - self._last_refresh_try < REFRESH_RETRY_SECONDS:
+            return 0
+        version = self._loaded_version
+        if version and datetime.utcnow() - version < timedelta(seconds=Config.LISTING_REFRESH_INTERVAL):
+            return 0
+        return self.refresh(stop_event)
+
+    # ----- DB 적재 -----
+    def load(self):
+        """DB에 저장된 전체 목록을 메모리에 적재"""
+        if not self._app:
+            return 0
+        try:
+            with self._app.app_context():
+                from models.listing import StockListing
+                rows = StockListing.query.all()
+                entries = [row.to_dict() for row in rows]
+                version = max((row.updated_at for row in rows if row.updated_at), default=None)
+        except Exception as e:
+            logging.error(f"상장 목록 로드 실패: {e}")
+            return 0
+
+        if entries:
+            self._set_index(entries, version)
+            logging.info(f"상장 목록 로드: {len(entries)}개 종목")
+        return len(entries)
+
+    def load_if_changed(self):
+        """다른 프로세스가 목록을 갱신했으면 다시 적재 (updated_at 최댓값 비교)"""
+        if not self._app:
+            return 0
+        self._last_reload_check = time.monotonic()
+        try:
+            with self._app.app_context():
+                from models.listing import StockListing
+                from utils.db import db
+                version = db.session.query(db.func.max(StockListing.updated_at)).scalar()
+        except Exception as e:
+            logging.error(f"상장 목록 변경 확인 실패: {e}")
+            return 0
+        if version and (self._loaded_version is None or version > self._loaded_version):
+            return self.load()
+        return 0
+
+    def _maybe_reload(self):
+        if self._app and time.monotonic() - self._last_reload_check >= RELOAD_CHECK_SECONDS:
+            self.load_if_changed()
+
+    def _set_index(self, entries, version):
+        index = dict(self._seed)
+        for entry in entries:
+            index[entry['symbol']] = {
+                'symbol': entry['symbol'],
+                'name': entry['name'],
+                'exchange': entry['exchange'],
+                'market': entry['market'],
+                'currency': entry['currency'],
+                'sector': entry.get('sector')
+            }
+        # 색인을 먼저 만들고 참조만 교체 (읽기는 잠금 없음)
+        search_index = SearchIndex(index.values())
+        self._by_symbol = index
+        self._index = search_index
+        self._loaded_version = version
+        self.is_loaded = True
+
+    # ----- 조회 -----
+    def get(self, symbol):
+        """종목 정보 (없으면 None)"""
+        self._maybe_reload()
+        return self._by_symbol.get(symbol)
+
+    def get_name(self, symbol, default=None):
+        entry = self.get(symbol)
+        return entry['name'] if entry else default
+
+    def is_korean(self, symbol):
+        """한국 시장 종목 여부 (목록에 없으면 None)"""
+        entry = self.get(symbol)
+        return entry['market'] == 'KRW' if entry else None
+
+    def search(self, query, limit=20):
+        """종목코드/종목명/초성 검색 (정확 > 접두 > 부분 일치 순 상위 limit개)"""
+        self._maybe_reload()
+        return self._index.search(query, limit)
+
+    def get_stats(self):
+        return {
+            'size': len(self._by_symbol),
+            'is_loaded': self.is_loaded,
+            'version': self._loaded_version.isoformat() if self._loaded_version else None
+        }
+
+
+# 전역 상장 종목 서비스 인스턴스
+listing_service = ListingService()
@@ -1,7 +1,11 @@
 from models.stock import MarketHours
 from datetime import datetime, time
-import pytz
+import logging
+import threading
+import time as _time
+from config import Config
 from utils.db import db
+from utils.session_calendar import SessionCalendar
 
 class MarketService:
     """시장 운영 시간 관리 서비스"""
@@ -33,57 +37,116 @@ class MarketService:
             'trading_days': market_hours.trading_days
         }
     
+    # 세션 캘린더 (프로세스당 1개, 운영 시간이 바뀌면 다시 계산)
+    _calendar = None
+    _calendar_checked_at = 0.0
+    _calendar_lock = threading.Lock()
+    
     @staticmethod
-    def is_market_open(market):
-        """현재 시장이 열려있는지 확인"""
-        market_hours = MarketHours.query.filter_by(market=market).first()
-        if not market_hours:
-            return {'is_open': False, 'message': '시장 정보를 찾을 수 없습니다'}
-        
-        # 해당 시장의 타임존으로 현재 시간 가져오기
-        tz = pytz.timezone(market_hours.timezone)
-        current_time = datetime.now(tz)
-        current_weekday = current_time.weekday()  # 0=월, 6=일
+    def _load_market_rows():
+        return [{
+            'market': m.market,
+            'open_time': m.open_time,
+            'close_time': m.close_time,
+            'timezone': m.timezone,
+            'trading_days': m.trading_days
+        } for m in MarketHours.query.all()]
+    
+    @staticmethod
+    def get_calendar():
+        """세션 캘린더 조회 (운영 시간 변경 여부는 MARKET_CALENDAR_REFRESH초마다 확인)"""
+        now = _time.monotonic()
+        calendar = MarketService._calendar
+        if calendar is not None and now - MarketService._calendar_checked_at < Config.MARKET_CALENDAR_REFRESH:
+            return calendar
         
-        # 주말 체크
-        if current_weekday >= 5:  # 토요일(5), 일요일(6)
-            return {
-                'is_open': False,
-                'message': '주말에는 거래할 수 없습니다',
-                'current_time': current_time.strftime('%Y-%m-%d %H:%M:%S %Z'),
-                'open_time': market_hours.open_time.strftime('%H:%M:%S'),
-                'close_time': market_hours.close_time.strftime('%H:%M:%S')
-            }
+        with MarketService._calendar_lock:
+            calendar = MarketService._calendar
+            if calendar is not None and now - MarketService._calendar_checked_at < Config.MARKET_CALENDAR_REFRESH:
+                return calendar
+            try:
+                rows = MarketService._load_market_rows()
+            except Exception as e:
+                if calendar is None:
+                    raise
+                logging.error(f"시장 운영 시간 조회 실패 (기존 캘린더 사용): {e}")
+                MarketService._calendar_checked_at = now
+                return calendar
+            
+            if calendar is None or calendar.signature != SessionCalendar.make_signature(rows):
+                calendar = SessionCalendar(rows)
+                MarketService._calendar = calendar
+                logging.info(f"거래 세션 캘린더 계산: {', '.join(calendar.markets)}")
+            MarketService._calendar_checked_at = now
+            return calendar
+    
+    @staticmethod
+    def reload_calendar():
+        """다음 조회 때 운영 시간을 다시 확인"""
+        MarketService._calendar_checked_at = 0.0
+    
+    @staticmethod
+    def is_open_now(market):
+        """현재 시장이 열려있는지 여부만 빠르게 확인 (주문/갱신 스케줄러용)"""
+        return MarketService.get_calendar().is_open(market)
+    
+    @staticmethod
+    def _format_ts(ts, tz):
+        return datetime.fromtimestamp(ts, tz).isoformat() if ts is not None else None
+    
+    @staticmethod
+    def _market_status(calendar, market, ts):
+        sessions = calendar.sessions(market, ts)
+        if sessions is None:
+            return {'is_open': False, 'message': '시장 정보를 찾을 수 없습니다'}
         
-        # 시간 체크
-        current_time_only = current_time.time()
-        is_open = market_hours.open_time <= current_time_only <= market_hours.close_time
+        tz = sessions.tz
+        current_time = datetime.fromtimestamp(ts, tz)
+        is_open = sessions.is_open(ts)
+        if is_open:
+            message = '거래 가능'
+        elif current_time.weekday() not in sessions.trading_days:
+            message = '주말에는 거래할 수 없습니다'
+        elif current_time.date() in sessions.holidays:
+            message = '휴장일입니다'
+        else:
+            message = '장 마감'
         
         return {
             'is_open': is_open,
-            'message': '거래 가능' if is_open else '장 마감',
+            'message': message,
             'current_time': current_time.strftime('%Y-%m-%d %H:%M:%S %Z'),
-            'open_time': market_hours.open_time.strftime('%H:%M:%S'),
-            'close_time': market_hours.close_time.strftime('%H:%M:%S'),
-            'timezone': market_hours.timezone
+            'open_time': sessions.open_time.strftime('%H:%M:%S'),
+            'close_time': sessions.close_time.strftime('%H:%M:%S'),
+            'timezone': tz.zone,
+            'next_open': MarketService._format_ts(sessions.next_open(ts), tz),
+            'next_close': MarketService._format_ts(sessions.next_close(ts), tz)
         }
     
+    @staticmethod
+    def is_market_open(market):
+        """현재 시장이 열려있는지 확인 (휴장일 반영, 다음 개장/마감 시각 포함)"""
+        return MarketService._market_status(MarketService.get_calendar(), market, _time.time())
+    
     @staticmethod
     def get_all_market_status():
-        """모든 시장의 현재 상태 조회"""
-        markets = MarketHours.query.all()
+        """모든 시장의 현재 상태 조회 (DB 조회 없이 캘린더 사용)"""
+        calendar = MarketService.get_calendar()
+        ts = _time.time()
         result = []
         
-        for market in markets:
-            status = MarketService.is_market_open(market.market)
+        for market in calendar.markets:
+            status = MarketService._market_status(calendar, market, ts)
             result.append({
-                'market': market.market,
+                'market': market,
                 'is_open': status['is_open'],
                 'message': status['message'],
                 'current_time': status.get('current_time'),
                 'open_time': status.get('open_time'),
                 'close_time': status.get('close_time'),
-                'timezone': market.timezone
+                'timezone': status.get('timezone'),
+                'next_open': status.get('next_open'),
+                'next_close': status.get('next_close')
             })
         
         return result
@@ -118,3 +181,4 @@ class MarketService:
             db.session.add(market)
         
         db.session.commit()
+        MarketService.reload_calendar()
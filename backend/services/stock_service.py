@@ -4,20 +4,107 @@ import time
 import logging
 import random
 import requests
-from datetime import datetime, timedelta
+import numpy as np
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait, TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta, timezone
 from flask import current_app
+from config import Config
+from utils.rate_limiter import TokenBucket
+from utils.single_flight import SingleFlight
+from utils.ttl_cache import TTLCache
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError, OPEN, http_status, is_not_found, is_provider_failure, is_transport_error
+from utils.quote_snapshot import QuoteStore, freeze_quote
+from utils.shared_quote_board import SharedQuoteBoard
+from utils.leader_election import DbLease, FileLease, LeaderElector
+from utils.refresh_scheduler import RefreshScheduler
+from utils.history_format import bars_to_compact, bars_to_records, compact_history, frame_columns, history_nbytes, history_records
+# 열 번호는 circuit_breaker.OPEN과 겹치지 않도록 BAR_ 접두어로 가져옴
+from utils.bar_store import BarStore, COLUMNS as BAR_COLUMNS, DATE as BAR_DATE, bars_from_frame, from_days, resample_bars, to_days
+from services.listing_service import listing_service
+
+# 시세를 얻은 quote_status
+QUOTE_FOUND = ('cached', 'fetched')
+
 
 class StockService:
     def __init__(self):
-        self.stock_cache = {}  # 메모리 캐시
+        self.stock_cache = QuoteStore(Config.QUOTE_BOARD_CAPACITY)  # 메모리 캐시 (copy-on-write 불변 스냅샷, 배열 기반)
+        self.shared_board = None  # 프로세스 간 공유 시세 보드 (멀티 프로세스 모드)
         self.update_thread = None
         self.is_running = False
+        self._stop_event = threading.Event()  # 자동 업데이트 대기를 즉시 깨우기 위한 이벤트
+        self.read_only = False  # True: 자동 갱신 종목/환율/지수는 수집 프로세스가 저장한 값만 읽음
+        self.leader = None  # 갱신 리더 선출기 (여러 프로세스/노드 중 1개만 갱신)
         self._app = None  # Flask 앱 참조
+
+        # 데이터 제공자별 토큰 버킷 (KRW: KRX/FDR, USD: FDR/yfinance)
+        self.rate_limiters = {
+            market: TokenBucket(limit['rate'], limit['burst'])
+            for market, limit in Config.PROVIDER_RATE_LIMITS.items()
+        }
+
+        # 데이터 제공자별 서킷 브레이커
+        self.circuit_breakers = {
+            market: CircuitBreaker(market, **Config.CIRCUIT_BREAKER)
+            for market in Config.PROVIDER_RATE_LIMITS
+        }
+
+        # 같은 종목 동시 조회 병합 (single-flight)
+        self._single_flight = SingleFlight()
+
+        # 자동 갱신 대상 외 종목용 조회 캐시 (read-through, LRU + TTL)
+        self.quote_cache = TTLCache(Config.QUOTE_CACHE_MAX_ENTRIES, Config.QUOTE_CACHE_TTL)
+
+        # 제공자에 존재하지 않는 것으로 확인된 종목 (네거티브 캐시)
+        self.negative_cache = TTLCache(Config.NEGATIVE_CACHE_MAX_ENTRIES, Config.NEGATIVE_CACHE_TTL)
+
+        # stale-while-revalidate 백그라운드 갱신
+        self._revalidate_executor = ThreadPoolExecutor(
+            max_workers=Config.QUOTE_REVALIDATE_WORKERS,
+            thread_name_prefix='quote-revalidate'
+        )
+        self._revalidating = {}  # symbol -> Future
+        self._revalidate_lock = threading.Lock()
+
+        # 조회수 공유 (웹 워커가 DB에 모아서 누적 -> 갱신 프로세스가 읽어 스케줄러에 반영)
+        self._view_buffer = Counter()  # 아직 DB에 더하지 않은 조회수
+        self._own_views = Counter()  # 이 프로세스가 DB에 더한 조회수 (이미 스케줄러에 반영됨)
+        self._view_lock = threading.Lock()
+        self._view_sync_lock = threading.Lock()  # DB 누적과 병합 읽기가 엇갈리지 않도록
+        self._views_flushed_at = time.monotonic()
+        self._views_merge_checked = 0.0
+        self._views_merged_at = None  # 마지막 병합에서 읽은 시각 (UTC, 이후 바뀐 행만 다시 읽음)
+        self._view_totals = None  # 마지막으로 읽은 DB 누적 조회수 {symbol: views}
+
+        # 종목별 마지막으로 받은 일봉 (시세 증분 조회용)
+        self._last_bars = TTLCache(
+            Config.QUOTE_CACHE_MAX_ENTRIES + Config.QUOTE_BOARD_CAPACITY,
+            Config.QUOTE_INITIAL_DAYS * 86400
+        )
+
+        # 일봉 로컬 저장소 (차트용, 부족한 구간만 제공자에서 보강)
+        self.bar_store = None
+        if Config.BAR_STORE_DIR:
+            try:
+                self.bar_store = BarStore(Config.BAR_STORE_DIR, Config.BAR_STORE_REFRESH)
+            except OSError as e:
+                logging.error(f"일봉 저장소 초기화 실패 ({Config.BAR_STORE_DIR}): {e}")
+        self._bar_flight = SingleFlight()
         
+        # 차트 응답 캐시 ((symbol, period, interval) -> ((일봉 버전, 시작일), 응답))
+        self.history_cache = TTLCache(
+            Config.HISTORY_CACHE_MAX_ENTRIES, Config.HISTORY_CACHE_TTL,
+            max_bytes=Config.HISTORY_CACHE_MAX_BYTES, sizeof=lambda entry: history_nbytes(entry[1])
+        )
+
         # 환율 정보 저장
         self.exchange_rate = 1350  # 기본 환율 (USD/KRW)
         self.last_exchange_update = None
         
+        # 환율/지수 스냅샷 메모리 캐시
+        self.market_data = TTLCache(8, Config.MARKET_DATA_TTL)
+        
         # 확장된 한국 주식 티커 목록
         self.kr_stocks = [
             '005930',  # 삼성전자
@@ -155,22 +242,203 @@ class StockService:
         
         # 모든 주식 목록
         self.all_stocks = self.kr_stocks + self.us_stocks
+        
+        # 전체 상장 목록을 받기 전까지 쓰는 기본 종목 목록
+        listing_service.seed(
+            [{'symbol': symbol, 'name': name, 'exchange': 'KRX', 'market': 'KRW', 'currency': 'KRW', 'sector': None}
+             for symbol, name in self.kr_stock_names.items()] +
+            [{'symbol': symbol, 'name': name, 'exchange': 'US', 'market': 'USD', 'currency': 'USD', 'sector': None}
+             for symbol, name in self.us_stock_names.items()]
+        )
+        
+        # 보유자 수/조회 빈도/변동성 기반 종목별 적응형 갱신 스케줄러
+        self.scheduler = RefreshScheduler(
+            market_of=lambda symbol: 'KRW' if self.is_korean_stock(symbol) else 'USD',
+            base_interval=Config.STOCK_UPDATE_INTERVAL,
+            **{k: v for k, v in Config.REFRESH_SCHEDULER.items() if k != 'tick'}
+        )
+        self.scheduler.pin(self.get_refresh_symbols())
+        
+        # 시장별 장 상태 (open: 마지막 확인 결과, settle_at: 종가 확정 조회 시각, settling: 확정 조회 진행 중)
+        self._market_sessions = {
+            market: {'open': None, 'settle_at': None, 'settling': False}
+            for market in Config.PROVIDER_RATE_LIMITS
+        }
     
     def init_app(self, app):
         """Flask 앱 초기화"""
         self._app = app
+        listing_service.init_app(app)
+
+    def attach_shared_board(self, name, writer=False):
+        """공유 메모리 시세 보드 사용 (writer: 갱신 프로세스, reader: 웹 워커)"""
+        self.shared_board = SharedQuoteBoard(name, create=writer, capacity=Config.QUOTE_BOARD_CAPACITY)
+        logging.info(f"공유 시세 보드 모드: {name} ({'writer' if writer else 'reader'})")
+
+    def enable_leader_election(self, mode):
+        """갱신 리더 선출 사용 (db: updater_leases 테이블, file: 로컬 파일 잠금)"""
+        lease_seconds = Config.UPDATER_LEASE_SECONDS
+        if mode == 'db' and self._app:
+            backend = DbLease(self._app, 'stock_updater', lease_seconds)
+        elif mode in ('db', 'file'):
+            # DB를 쓰지 않는 앱은 단일 호스트 파일 잠금으로 대체
+            backend = FileLease(Config.UPDATER_LOCK_FILE)
+            mode = 'file'
+        else:
+            logging.warning(f"지원하지 않는 리더 선출 방식: {mode} (리더 선출 없이 갱신)")
+            return
+        self.leader = LeaderElector(backend, heartbeat_seconds=max(1, lease_seconds / 3))
+        logging.info(f"갱신 리더 선출 사용: {mode} (lease {lease_seconds}초)")
+
+    def is_updater_leader(self):
+        """이 프로세스가 갱신을 담당하는지 확인 (리더 선출을 쓰지 않으면 항상 True)"""
+        if self.read_only:
+            return False
+        return self.leader is None or self.leader.is_leader
+
+    def enable_read_only(self):
+        """읽기 전용 모드 (시세 수집은 별도 수집 프로세스가 담당)"""
+        self.read_only = True
+        logging.info("주식 서비스 읽기 전용 모드: 수집 프로세스가 저장한 시세/환율/지수를 사용")
+
+    def _is_shared_reader(self):
+        """공유 보드를 읽기만 하는 워커인지 확인"""
+        return self.shared_board is not None and not self.shared_board.writable
+
+    def _get_memory_quote(self, symbol):
+        """메모리 시세 (로컬 스냅샷, reader 모드면 공유 보드)"""
+        stock_data = self.stock_cache.get(symbol)
+        if stock_data is None and self._is_shared_reader():
+            quote = self.shared_board.get_quote(symbol)
+            stock_data = freeze_quote(quote) if quote else None
+        return stock_data
+
+    def _get_memory_quotes(self, symbols):
+        """여러 종목 메모리 시세 {symbol: 시세} (한 스냅샷 기준, reader 모드면 없는 종목은 공유 보드)"""
+        quotes = self.stock_cache.get_many(symbols)
+        if self._is_shared_reader():
+            for symbol in symbols:
+                if symbol not in quotes:
+                    quote = self.shared_board.get_quote(symbol)
+                    if quote:
+                        quotes[symbol] = freeze_quote(quote)
+        return quotes
+
+    def _publish_quotes(self, quotes):
+        """갱신된 시세를 메모리 스냅샷(및 writer면 공유 보드)에 반영"""
+        if not quotes:
+            return
+        self.stock_cache.update(quotes)
+        if self.shared_board is not None and self.shared_board.writable:
+            self.shared_board.write_many(quotes)
+
+    def _throttle(self, market, backoff=0.0):
+        """데이터 제공자 호출 전 토큰 획득 (제공자 한도만큼만 대기)
+
+        backoff(초)를 주면 그 시간 동안 충전될 토큰을 더 가져가므로 같은 제공자의 다른 요청도 함께 늦춰짐.
+        종료 요청(_stop_event)으로 대기가 중단되면 False
+        """
+        limiter = self.rate_limiters.get(market)
+        if limiter:
+            return limiter.acquire(1 + backoff * limiter.rate, cancel=self._stop_event)
+        return True
+
+    def _read_provider(self, market, symbol, start, end, attempts=1, retry_delay=(2, 5)):
+        """서킷 브레이커 + 속도 제한을 거쳐 fdr.DataReader 호출
+
+        attempts번까지 재시도하지만 브레이커에는 논리적 요청 1건으로 한 번만 기록하고,
+        없는 종목(404, 상장 목록에 없는 종목)은 재시도하지도 실패로 세지도 않는다.
+        """
+        breaker = self.circuit_breakers[market]
+        if not breaker.allow_request():
+            raise CircuitOpenError(market)
+        
+        error, not_found = None, False
+        for attempt in range(attempts):
+            # 재시도 간 지연도 제공자 토큰 버킷에서 대기 (429 에러 방지)
+            if not self._throttle(market, random.uniform(*retry_delay) * (attempt + 1) if attempt else 0.0):
+                # 종료 요청: 남은 조회/재시도를 하지 않고 브레이커에도 기록하지 않음
+                breaker.release()
+                raise error or RuntimeError(f"종료 요청으로 제공자 조회 중단: {symbol}")
+            try:
+                df = fdr.DataReader(symbol, start, end)
+            except Exception as e:
+                error = e
+                not_found = self._is_not_found_error(symbol, e)
+                if not_found:
+                    break  # 없는 종목은 재시도하지 않음
+                logging.warning(f"{market} 제공자 조회 시도 {attempt + 1} 실패 {symbol}: {e}")
+                continue
+            breaker.record_success()
+            return df
+        
+        if is_provider_failure(error) and not not_found:
+            breaker.record_failure()
+        else:
+            # 종목 오류 등은 제공자 상태와 무관하므로 기록하지 않음
+            breaker.release()
+        raise error
+
+    def _read_latest_bar(self, market, symbol, attempts=1, retry_delay=(2, 5)):
+        """최신 일봉과 전일 종가 (증분 조회)
+
+        종목별로 마지막에 받은 봉의 날짜/종가를 기억해 두고 그 날짜부터만 조회한다
+        (장중 미완성 봉을 갱신하기 위해 마지막 날짜도 포함). 기억이 없으면 QUOTE_INITIAL_DAYS일 조회.
+        반환: (최신 봉 Series, 전일 종가 또는 None) - 데이터가 없으면 (None, None)
+        """
+        today = datetime.now().date()
+        state = self._last_bars.get(symbol)
+        start = state['date'] if state else today - timedelta(days=Config.QUOTE_INITIAL_DAYS)
+        
+        df = self._read_provider(market, symbol, start.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'),
+                                 attempts, retry_delay)
+        df = df[df['Close'].notna()] if not df.empty else df
+        if df.empty:
+            if state:
+                # 새 봉이 아직 없으면 기억한 봉 사용
+                return state['bar'], state['previous_close']
+            return None, None
+        
+        latest = df.iloc[-1]
+        latest_date = df.index[-1].date()
+        if len(df) >= 2:
+            previous_close = float(df['Close'].iloc[-2])
+        elif state and latest_date > state['date']:
+            previous_close = state['close']
+        elif state:
+            previous_close = state['previous_close']
+        else:
+            previous_close = None
+        
+        self._last_bars.set(symbol, {
+            'date': latest_date,
+            'close': float(latest['Close']),
+            'previous_close': previous_close,
+            'bar': latest
+        })
+        return latest, previous_close
     
-    def _save_to_db(self, symbol, data):
-        """MySQL에 캐시 데이터 저장"""
-        if not self._app:
+    def _circuit_open_fallback(self, symbol, is_korean):
+        """브레이커가 열려 있을 때: 메모리에 있는 마지막 시세, 없으면 fallback 데이터"""
+        stock_data = self._get_memory_quote(symbol)
+        if stock_data:
+            return stock_data
+        entry = self.quote_cache.peek(symbol)
+        if entry:
+            return entry[0]
+        return self.get_fallback_data(symbol, is_korean=is_korean)
+
+    def _save_many_to_db(self, quotes):
+        """여러 종목 시세를 한 번의 app_context / 트랜잭션으로 일괄 저장"""
+        if not self._app or not quotes:
             return
         
         try:
             with self._app.app_context():
-                from models.stock import StockCache
-                StockCache.upsert(symbol, data)
+                from models.stock import Stock
+                Stock.bulk_upsert(quotes)
         except Exception as e:
-            logging.error(f"MySQL 캐시 저장 실패 {symbol}: {e}")
+            logging.error(f"MySQL 일괄 저장 실패 ({len(quotes)}개 종목): {e}")
     
     def _load_from_db(self, symbol):
         """MySQL에서 캐시 데이터 로드"""
@@ -188,6 +456,52 @@ class StockService:
         
         return None
     
+    def _load_many_from_db(self, symbols):
+        """여러 종목의 MySQL 캐시 데이터를 한 번에 로드 {symbol: stock_data}"""
+        if not self._app or not symbols:
+            return {}
+        
+        try:
+            with self._app.app_context():
+                from models.stock import StockCache
+                rows = StockCache.query.filter(StockCache.symbol.in_(list(symbols))).all()
+                return {row.symbol: row.to_dict() for row in rows}
+        except Exception as e:
+            logging.error(f"MySQL 캐시 일괄 로드 실패: {e}")
+        
+        return {}
+    
+    def _save_market_snapshot(self, key, value):
+        """환율/지수 스냅샷을 메모리와 DB에 저장"""
+        self.market_data.set(key, value)
+        if not self._app:
+            return
+        
+        try:
+            with self._app.app_context():
+                from models.stock import MarketSnapshot
+                MarketSnapshot.save(key, value)
+        except Exception as e:
+            logging.error(f"시장 데이터 스냅샷 저장 실패 {key}: {e}")
+    
+    def _read_market_snapshot(self, key):
+        """환율/지수 스냅샷 조회 (메모리 캐시 → DB)"""
+        value = self.market_data.get(key)
+        if value is not None or not self._app:
+            return value
+        
+        try:
+            with self._app.app_context():
+                from models.stock import MarketSnapshot
+                value = MarketSnapshot.load(key)
+        except Exception as e:
+            logging.error(f"시장 데이터 스냅샷 로드 실패 {key}: {e}")
+            return None
+        
+        if value is not None:
+            self.market_data.set(key, value)
+        return value
+    
     def update_exchange_rate(self):
         """실시간 환율 업데이트"""
         try:
@@ -197,6 +511,7 @@ class StockService:
                 if not usd_krw.empty:
                     self.exchange_rate = float(usd_krw.iloc[-1]['Close'])
                     self.last_exchange_update = datetime.utcnow()
+                    self._save_market_snapshot('exchange_rate', self.exchange_rate)
                     logging.info(f"환율 업데이트 (FDR): 1 USD = {self.exchange_rate} KRW")
                     return
             except Exception as fdr_error:
@@ -211,6 +526,7 @@ class StockService:
                 data = response.json()
                 self.exchange_rate = data['rates'].get('KRW', 1350)
                 self.last_exchange_update = datetime.utcnow()
+                self._save_market_snapshot('exchange_rate', self.exchange_rate)
                 logging.info(f"환율 업데이트 (API): 1 USD = {self.exchange_rate} KRW")
             else:
                 logging.warning(f"환율 API 응답 실패: {response.status_code}")
@@ -222,193 +538,222 @@ class StockService:
     
     def get_exchange_rate(self):
         """현재 환율 반환"""
+        if self.read_only:
+            # 수집 프로세스가 저장한 환율 사용
+            rate = self._read_market_snapshot('exchange_rate')
+            if rate is not None:
+                self.exchange_rate = rate
+            return self.exchange_rate
+        
         # 30분마다 환율 업데이트
         if (not self.last_exchange_update or 
             datetime.utcnow() - self.last_exchange_update > timedelta(minutes=30)):
             self.update_exchange_rate()
         return self.exchange_rate
     
-    def search_stocks(self, query):
+    def search_stocks(self, query, quotes=None):
         """주식 검색 메인 메서드"""
-        return self.search_stocks_extended(query)
+        return self.search_stocks_extended(query, quotes)
     
-    def search_stocks_extended(self, query):
-        """확장된 주식 검색 (FinanceDataReader만 사용)"""
-        results = []
-        query_upper = query.upper()
-        query_lower = query.lower()
-        
-        # 먼저 캐시된 주식에서 검색
-        for symbol in self.all_stocks:
-            stock_name = self.kr_stock_names.get(symbol) or self.us_stock_names.get(symbol, '')
-            if (query_upper in symbol.upper() or 
-                query_lower in stock_name.lower()):
-                stock_data = self.get_cached_stock_data(symbol) or self.get_stock_info(symbol)
-                if stock_data:
-                    # 기업명이 없으면 매핑에서 가져오기
-                    if not stock_data.get('name') or stock_data['name'] == symbol:
-                        stock_data['name'] = stock_name or symbol
-                    results.append(stock_data)
-        
-        # 추가 검색이 필요한 경우 FinanceDataReader 사용
-        if len(results) < 10 and len(query) >= 2:
-            try:
-                # 한국 주식 검색
-                if len(results) < 10:
-                    try:
-                        stock_list = fdr.StockListing('KRX')
-                        matched = stock_list[
-                            (stock_list['Code'].str.contains(query_upper, case=False, na=False)) |
-                            (stock_list['Name'].str.contains(query, case=False, na=False))
-                        ].head(10 - len(results))
-                        
-                        for _, row in matched.iterrows():
-                            code = row['Code']
-                            name = row['Name']
-                            
-                            # 중복 체크
-                            if not any(r['symbol'] == code for r in results):
-                                stock_data = self.get_kr_stock_info(code)
-                                if stock_data:
-                                    stock_data['name'] = name  # 실제 이름으로 업데이트
-                                    results.append(stock_data)
-                                    
-                    except Exception as e:
-                        logging.debug(f"KRX 검색 실패: {e}")
-                
-                # 미국 주식 직접 조회 시도
-                if len(results) < 10 and len(query) <= 5:
-                    try:
-                        stock_data = self.get_us_stock_info(query_upper)
-                        if stock_data and not any(r['symbol'] == query_upper for r in results):
-                            results.append(stock_data)
-                    except Exception as e:
-                        logging.debug(f"미국 주식 직접 조회 실패 {query_upper}: {e}")
-                        
-            except Exception as e:
-                logging.debug(f"확장 검색 실패: {e}")
+    def search_stocks_extended(self, query, quotes=None, limit=20):
+        """확장된 주식 검색 (상장 종목 마스터 기준)
+
+        1단계: 색인에서 종목 정보(종목코드/종목명/시장)를 찾음 (네트워크 호출 없음)
+        2단계: quotes 설정에 따라 시세 첨부
+            none   - 종목 정보만 반환
+            cached - 메모리/조회 캐시/DB에 있는 시세만 첨부
+            fetch  - 캐시에 없는 시세는 SEARCH_QUOTE_DEADLINE초까지 병렬 조회 (남은 조회는 백그라운드에서 계속)
+        """
+        quotes = quotes or Config.SEARCH_QUOTE_MODE
+        entries = listing_service.search(query, limit)
+        
+        # 전체 목록을 아직 받지 못했으면 미국 종목코드 직접 조회 (시세를 얻은 경우만 결과에 포함)
+        query_upper = query.strip().upper()
+        direct = None
+        if (quotes == 'fetch' and not listing_service.is_loaded and len(entries) < 10
+                and len(query_upper) <= 5 and query_upper.isascii() and query_upper.isalpha()
+                and not any(e['symbol'] == query_upper for e in entries)):
+            direct = {'symbol': query_upper, 'name': query_upper, 'exchange': None,
+                      'market': 'USD', 'currency': 'USD', 'sector': None}
+            entries.append(direct)
+        
+        if quotes == 'none':
+            return [dict(entry, quote_status='none') for entry in entries]
         
-        return results[:20]  # 최대 20개 결과
+        results = self._attach_quotes(entries, fetch=quotes == 'fetch')
+        if direct is not None and results[-1]['quote_status'] not in QUOTE_FOUND:
+            results.pop()
+        return results[:limit]
     
-    def get_kr_stock_info(self, symbol, max_retries=3):
-        """한국 주식 정보 조회 (FinanceDataReader 사용)"""
-        for attempt in range(max_retries):
-            try:
-                # 요청 간 지연 추가 (429 에러 방지)
-                if attempt > 0:
-                    delay = random.uniform(2, 5) * (attempt + 1)
-                    time.sleep(delay)
-                
-                # FinanceDataReader로 최근 30일 데이터 가져오기
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=30)
-                
-                df = fdr.DataReader(symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-                
-                if df.empty:
-                    continue
-                
-                # 최신 데이터 (마지막 행)
-                latest_data = df.iloc[-1]
-                current_price = float(latest_data['Close'])
-                
-                # 전일 종가 (마지막에서 두 번째 행)
-                if len(df) >= 2:
-                    previous_close = float(df.iloc[-2]['Close'])
-                else:
-                    previous_close = current_price * 0.99  # 1% 하락으로 가정
-                
-                stock_name = self.kr_stock_names.get(symbol, symbol)
-                
-                stock_data = {
-                    'symbol': symbol,
-                    'name': stock_name,
-                    'current_price': current_price,
-                    'previous_close': previous_close,
-                    'open_price': float(latest_data['Open']),
-                    'high_price': float(latest_data['High']),
-                    'low_price': float(latest_data['Low']),
-                    'volume': int(latest_data['Volume']) if 'Volume' in latest_data else 0,
-                    'change': current_price - previous_close,
-                    'change_percent': (current_price - previous_close) / previous_close * 100 if previous_close > 0 else 0,
-                    'market': 'KRW',
-                    'currency': 'KRW',
-                    'updated_at': datetime.utcnow()
-                }
-                
-                logging.info(f"한국 주식 데이터 성공 조회: {symbol} - ₩{current_price:,.0f}")
-                return stock_data
-                
-            except Exception as e:
-                logging.warning(f"한국 주식 조회 시도 {attempt + 1} 실패 {symbol}: {e}")
-                if attempt == max_retries - 1:
-                    return self.get_fallback_data(symbol, is_korean=True)
+    def _attach_quotes(self, entries, fetch=False, deadline=None):
+        """종목 목록에 시세 일괄 첨부
+
+        quote_status: cached(캐시된 시세), fetched(이번에 조회), pending(제한 시간 초과, 백그라운드 조회 중),
+        not_found(제공자에 없는 종목), error(조회 실패), missing(캐시에 없고 조회하지 않음)
+        """
+        deadline = Config.SEARCH_QUOTE_DEADLINE if deadline is None else deadline
+        symbols = [entry['symbol'] for entry in entries]
+        not_found = {symbol for symbol in symbols if self.is_known_missing(symbol)}
+        found = self._get_memory_quotes([symbol for symbol in symbols if symbol not in not_found])
+        misses = []
+        for symbol in symbols:
+            if symbol in not_found or symbol in found:
                 continue
+            entry = self.quote_cache.peek(symbol)
+            if entry:
+                found[symbol] = entry[0]
+            else:
+                misses.append(symbol)
+        
+        # 메모리에 없는 종목은 DB에서 한 번에 조회
+        if misses:
+            for symbol, stock_data in self._load_many_from_db(misses).items():
+                found[symbol] = self._store_quote(symbol, stock_data)
+            misses = list(dict.fromkeys(symbol for symbol in misses if symbol not in found))
+        
+        futures = {}
+        if fetch:
+            # 오래된 시세는 기다리지 않고 백그라운드 갱신만 예약
+            for symbol, stock_data in found.items():
+                age = self._quote_age(stock_data)
+                if (age is None or age > Config.QUOTE_SOFT_TTL) and not self._served_by_updater(symbol, age):
+                    self._schedule_revalidate(symbol)
+            # 없는 시세는 병렬로 조회하고 deadline까지만 기다림 (종목 수와 관계없이 지연 시간 상한 고정)
+            futures = {symbol: self._schedule_revalidate(symbol) for symbol in misses}
+            if futures:
+                wait(list(futures.values()), timeout=deadline)
         
-        return self.get_fallback_data(symbol, is_korean=True)
+        results = []
+        for entry in entries:
+            symbol = entry['symbol']
+            stock_data, status = found.get(symbol), 'cached'
+            if stock_data is None:
+                future = futures.get(symbol)
+                if symbol in not_found:
+                    status = 'not_found'
+                elif future is None:
+                    status = 'missing'
+                elif not future.done():
+                    status = 'pending'
+                elif future.exception() is not None:
+                    status = 'error'
+                elif future.result():
+                    stock_data, status = future.result(), 'fetched'
+                else:
+                    status = 'not_found'
+            # 캐시된 시세는 불변이므로 사본에 종목 정보 반영
+            result = {**stock_data, **entry} if stock_data else dict(entry)
+            result['quote_status'] = status
+            results.append(result)
+        return results
+    
+    def get_kr_stock_info(self, symbol, max_retries=3):
+        """한국 주식 정보 조회 (FinanceDataReader 사용)"""
+        if self.circuit_breakers['KRW'].state == OPEN:
+            return self._circuit_open_fallback(symbol, is_korean=True)
+        try:
+            # 마지막으로 받은 봉 이후만 조회 (최신 봉과 전일 종가, 실패 시 max_retries번까지 재시도)
+            latest_data, previous_close = self._read_latest_bar('KRW', symbol, self._fetch_attempts(symbol, max_retries), (2, 5))
+            
+            if latest_data is None:
+                # 제공자에 데이터가 없는 종목 - 가짜 시세 대신 없음으로 처리
+                return self._handle_not_found(symbol)
+            
+            current_price = float(latest_data['Close'])
+            
+            if previous_close is None:
+                previous_close = current_price * 0.99  # 1% 하락으로 가정
+            
+            stock_name = self.get_stock_name(symbol)
+            
+            stock_data = {
+                'symbol': symbol,
+                'name': stock_name,
+                'current_price': current_price,
+                'previous_close': previous_close,
+                'open_price': float(latest_data['Open']),
+                'high_price': float(latest_data['High']),
+                'low_price': float(latest_data['Low']),
+                'volume': int(latest_data['Volume']) if 'Volume' in latest_data else 0,
+                'change': current_price - previous_close,
+                'change_percent': (current_price - previous_close) / previous_close * 100 if previous_close > 0 else 0,
+                'market': 'KRW',
+                'currency': 'KRW',
+                'updated_at': datetime.utcnow()
+            }
+            
+            logging.info(f"한국 주식 데이터 성공 조회: {symbol} - ₩{current_price:,.0f}")
+            return stock_data
+            
+        except CircuitOpenError:
+            return self._circuit_open_fallback(symbol, is_korean=True)
+        except Exception as e:
+            if self._is_not_found_error(symbol, e):
+                return self._handle_not_found(symbol)
+            logging.warning(f"한국 주식 조회 실패 {symbol}: {e}")
+            return self.get_fallback_data(symbol, is_korean=True)
     
     def get_us_stock_info(self, symbol, max_retries=3):
         """미국 주식 정보 조회 (FinanceDataReader만 사용)"""
-        for attempt in range(max_retries):
-            try:
-                # 요청 간 지연 추가 (429 에러 방지)
-                if attempt > 0:
-                    delay = random.uniform(3, 6) * (attempt + 1)  # 미국 주식은 더 긴 지연
-                    time.sleep(delay)
-                
-                # FinanceDataReader로 미국 주식 데이터 가져오기
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=30)
-                
-                df = fdr.DataReader(symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-                
-                if df.empty:
-                    raise ValueError(f"데이터가 없습니다: {symbol}")
-                
-                latest_data = df.iloc[-1]
-                current_price = float(latest_data['Close'])
-                
-                # 비정상적인 가격 필터링 (USD 기준)
-                if current_price > 50000 or current_price < 0.01:
-                    raise ValueError(f"비정상적인 가격: {current_price}")
-                
-                if len(df) >= 2:
-                    previous_close = float(df.iloc[-2]['Close'])
-                else:
-                    previous_close = current_price * 0.99
-                
-                stock_name = self.us_stock_names.get(symbol, symbol)
-                
-                stock_data = {
-                    'symbol': symbol,
-                    'name': stock_name,
-                    'current_price': current_price,  # USD 가격 그대로
-                    'previous_close': previous_close,
-                    'open_price': float(latest_data['Open']),
-                    'high_price': float(latest_data['High']),
-                    'low_price': float(latest_data['Low']),
-                    'volume': int(latest_data['Volume']) if 'Volume' in latest_data else 0,
-                    'change': current_price - previous_close,
-                    'change_percent': (current_price - previous_close) / previous_close * 100 if previous_close > 0 else 0,
-                    'market': 'USD',
-                    'currency': 'USD',
-                    'exchange_rate': self.get_exchange_rate(),  # 환율 정보 추가
-                    'updated_at': datetime.utcnow()
-                }
-                
-                logging.info(f"미국 주식 데이터 성공 조회 (FDR): {symbol} - ${current_price:.2f}")
-                return stock_data
-                
-            except Exception as e:
-                logging.warning(f"미국 주식 조회 시도 {attempt + 1} 실패 {symbol}: {e}")
-                if attempt == max_retries - 1:
-                    return self.get_fallback_data(symbol, is_korean=False)
-                continue
-        
-        return self.get_fallback_data(symbol, is_korean=False)
+        if self.circuit_breakers['USD'].state == OPEN:
+            return self._circuit_open_fallback(symbol, is_korean=False)
+        try:
+            # 마지막으로 받은 봉 이후만 조회 (최신 봉과 전일 종가, 실패 시 max_retries번까지 재시도)
+            latest_data, previous_close = self._read_latest_bar('USD', symbol, self._fetch_attempts(symbol, max_retries), (3, 6))
+            
+            if latest_data is None:
+                # 제공자에 데이터가 없는 종목 - 가짜 시세 대신 없음으로 처리
+                return self._handle_not_found(symbol)
+            
+            current_price = float(latest_data['Close'])
+            
+            # 비정상적인 가격 필터링 (USD 기준)
+            if current_price > 50000 or current_price < 0.01:
+                raise ValueError(f"비정상적인 가격: {current_price}")
+            
+            if previous_close is None:
+                previous_close = current_price * 0.99
+            
+            stock_name = self.get_stock_name(symbol)
+            
+            stock_data = {
+                'symbol': symbol,
+                'name': stock_name,
+                'current_price': current_price,  # USD 가격 그대로
+                'previous_close': previous_close,
+                'open_price': float(latest_data['Open']),
+                'high_price': float(latest_data['High']),
+                'low_price': float(latest_data['Low']),
+                'volume': int(latest_data['Volume']) if 'Volume' in latest_data else 0,
+                'change': current_price - previous_close,
+                'change_percent': (current_price - previous_close) / previous_close * 100 if previous_close > 0 else 0,
+                'market': 'USD',
+                'currency': 'USD',
+                'exchange_rate': self.get_exchange_rate(),  # 환율 정보 추가
+                'updated_at': datetime.utcnow()
+            }
+            
+            logging.info(f"미국 주식 데이터 성공 조회 (FDR): {symbol} - ${current_price:.2f}")
+            return stock_data
+            
+        except CircuitOpenError:
+            return self._circuit_open_fallback(symbol, is_korean=False)
+        except Exception as e:
+            if self._is_not_found_error(symbol, e):
+                return self._handle_not_found(symbol)
+            logging.warning(f"미국 주식 조회 실패 {symbol}: {e}")
+            return self.get_fallback_data(symbol, is_korean=False)
+    
+    def get_stock_name(self, symbol):
+        """종목명 (상장 목록 기준, 없으면 종목코드)"""
+        return listing_service.get_name(symbol, symbol)
     
     def is_korean_stock(self, symbol):
         """한국 주식인지 확인"""
+        # 상장 목록에 있으면 목록의 시장 구분을 따름
+        is_korean = listing_service.is_korean(symbol)
+        if is_korean is not None:
+            return is_korean
         # 숫자로만 구성된 6자리 코드는 한국 주식
         if symbol.isdigit() and len(symbol) == 6:
             return True
@@ -420,12 +765,100 @@ class StockService:
             return True
         return False
     
-    def get_stock_info(self, symbol):
-        """단일 주식 정보 조회 (자동 구분)"""
+    def get_stock_info(self, symbol, use_cache=True):
+        """단일 주식 정보 조회 (자동 구분)
+
+        use_cache=True면 조회 캐시에 신선한 값이 있을 때 네트워크 호출 없이 반환
+        """
         if self.is_korean_stock(symbol):
-            return self.get_kr_stock_info(symbol)
+            return self._fetch_coalesced(symbol, self.get_kr_stock_info, use_cache)
+        else:
+            return self._fetch_coalesced(symbol, self.get_us_stock_info, use_cache)
+    
+    def _fetch_coalesced(self, symbol, fetcher, use_cache=True):
+        """조회 캐시 확인 후, 같은 종목에 대한 동시 조회는 진행 중인 1건의 결과를 공유"""
+        if self.is_known_missing(symbol):
+            return None
+        if use_cache:
+            cached = self.quote_cache.get(symbol)
+            if cached:
+                return cached
+        return self._single_flight.do(symbol, lambda: self._store_quote(symbol, fetcher(symbol)))
+    
+    def _fetch_attempts(self, symbol, max_retries):
+        """조회 시도 횟수 (전체 상장 목록에 없는 종목은 재시도하지 않음)"""
+        if listing_service.is_loaded and listing_service.get(symbol) is None:
+            return 1
+        return max_retries
+    
+    def _is_not_found_error(self, symbol, error):
+        """종목 없음으로 볼 오류: 404 응답, 또는 전체 상장 목록에 없는 종목의 응답 해석 오류"""
+        if is_not_found(error):
+            return True
+        return (http_status(error) is None and not is_transport_error(error)
+                and listing_service.is_loaded and listing_service.get(symbol) is None)
+    
+    def _handle_not_found(self, symbol):
+        """제공자에 없는 종목: 가짜 시세를 만들지 않고 None 반환
+
+        상장 목록에도 없을 때만 네거티브 캐시에 기록한다 (일시적인 빈 응답으로 상장 종목이
+        NEGATIVE_CACHE_TTL 동안 숨겨지지 않도록)
+        """
+        if listing_service.get(symbol) is None:
+            self._mark_not_found(symbol)
         else:
-            return self.get_us_stock_info(symbol)
+            logging.warning(f"상장 종목이지만 제공자 데이터 없음: {symbol}")
+        return None
+    
+    def _mark_not_found(self, symbol):
+        """존재하지 않는 종목으로 기록 (TTL 동안 네트워크 조회 생략)"""
+        logging.info(f"존재하지 않는 종목으로 기록: {symbol}")
+        self.negative_cache.set(symbol, True)
+        self.quote_cache.pop(symbol)
+    
+    def is_known_missing(self, symbol):
+        """네거티브 캐시에 있는(존재하지 않는 것으로 확인된) 종목인지 확인"""
+        return self.negative_cache.get(symbol) is not None
+    
+    def _store_quote(self, symbol, stock_data):
+        """조회 결과를 불변 시세로 조회 캐시에 저장 (시세의 updated_at 기준으로 TTL 적용)"""
+        stock_data = freeze_quote(stock_data)
+        if stock_data:
+            self.quote_cache.set(symbol, stock_data, self._quote_timestamp(stock_data))
+        return stock_data
+    
+    def _quote_timestamp(self, stock_data):
+        """시세의 updated_at(UTC naive)을 epoch 초로 변환"""
+        updated_at = stock_data.get('updated_at')
+        if isinstance(updated_at, datetime):
+            return updated_at.replace(tzinfo=timezone.utc).timestamp()
+        return None
+    
+    def get_fetch_stats(self):
+        """제공자 조회 통계 (실제 조회 수 / 병합된 조회 수)"""
+        return self._single_flight.get_stats()
+    
+    def get_stats(self):
+        """주식 서비스 모니터링 지표"""
+        return {
+            'fetch': self.get_fetch_stats(),
+            'quote_cache': self.quote_cache.get_stats(),
+            'negative_cache': self.negative_cache.get_stats(),
+            'quote_snapshot': self.stock_cache.get_stats(),
+            'listings': listing_service.get_stats(),
+            'bar_store': self.bar_store.get_stats() if self.bar_store else None,
+            'history_cache': self.history_cache.get_stats(),
+            'shared_board': self.shared_board.get_stats() if self.shared_board else None,
+            'leader': self.leader.get_stats() if self.leader else None,
+            'scheduler': self.scheduler.get_stats(),
+            'market_sessions': {
+                market: {'open': session['open'], 'settling': session['settling'] or session['settle_at'] is not None}
+                for market, session in self._market_sessions.items()
+            },
+            'circuit_breakers': {
+                market: breaker.get_stats() for market, breaker in self.circuit_breakers.items()
+            }
+        }
     
     def get_fallback_data(self, symbol, is_korean=True):
         """fallback 데이터 생성"""
@@ -437,7 +870,7 @@ class StockService:
                 '373220': 400000, '005490': 300000, '000270': 80000,
                 '105560': 60000, '055550': 35000, '032830': 70000,
             }
-            stock_name = self.kr_stock_names.get(symbol, symbol)
+            stock_name = self.get_stock_name(symbol)
             market = 'KRW'
             default_price = 50000
         else:
@@ -447,7 +880,7 @@ class StockService:
                 'META': 350, 'NVDA': 800, 'NFLX': 450, 'AMD': 140, 'INTC': 25,
                 'JPM': 150, 'V': 250, 'JNJ': 160, 'WMT': 150, 'PG': 150,
             }
-            stock_name = self.us_stock_names.get(symbol, symbol)
+            stock_name = self.get_stock_name(symbol)
             market = 'USD'
             default_price = 100
         
@@ -498,8 +931,11 @@ class StockService:
             
         return result
     
-    def get_stock_history(self, symbol, period_days=30, interval='daily'):
-        """주식 이력 데이터 조회 (차트용) - 개선된 버전"""
+    def get_stock_history(self, symbol, period_days=30, interval='daily', fmt='json'):
+        """주식 이력 데이터 조회 (차트용) - 개선된 버전
+
+        fmt: json(봉별 dict 목록) 또는 columnar(델타 인코딩 열 형식, utils.history_format.compact_history)
+        """
         try:
             # 주간, 월간 데이터는 장기 기간 가져오기
             if interval == 'weekly':
@@ -516,194 +952,600 @@ class StockService:
                     ticker = yf.Ticker(symbol)
                     df = ticker.history(period='1d', interval='1h')
                     
+                    if not df.empty and fmt == 'columnar':
+                        # 거래소 현지 시각 기준 분 단위
+                        minutes = df.index.tz_localize(None).values.astype('datetime64[m]').astype(np.int64)
+                        return compact_history(minutes, *frame_columns(df), time_unit='minute')
                     if not df.empty:
-                        history_data = []
-                        for index, row in df.iterrows():
-                            history_data.append({
-                                'date': index.strftime('%Y-%m-%d %H:%M'),
-                                'open': float(row['Open']),
-                                'high': float(row['High']),
-                                'low': float(row['Low']),
-                                'close': float(row['Close']),
-                                'volume': int(row['Volume']) if 'Volume' in row else 0
-                            })
-                        return history_data
+                        return history_records(
+                            df.index.strftime('%Y-%m-%d %H:%M').tolist(), *frame_columns(df),
+                            mark_extremes=False
+                        )
                 except Exception as e:
                     logging.debug(f"1일 시간별 데이터 조회 실패 {symbol}: {e}")
             
             start_date = end_date - timedelta(days=period_days)
+            start_day = float(to_days(np.datetime64(start_date.date())))
             
-            # FinanceDataReader로 이력 데이터 가져오기
-            df = fdr.DataReader(symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+            # 제공자를 호출하지 않고 알 수 있는 버전이 만들어 둔 응답과 같으면 바로 재사용
+            cache_key = (symbol, period_days, interval, fmt)
+            cached = self.history_cache.get(cache_key)
+            version = self._daily_bars_version(symbol, start_day)
+            if cached is not None and version is not None and cached[0] == (version, start_day):
+                return cached[1]
             
-            if df.empty:
-                return []
+            # 일봉 저장소에서 읽기 (없거나 오래된 구간만 FinanceDataReader로 보강)
+            bars, version = self.get_daily_bars(symbol, start_date, end_date)
             
-            # 주간/월간 데이터 처리
-            if interval == 'weekly':
-                df = df.resample('W').agg({
-                    'Open': 'first',
-                    'High': 'max',
-                    'Low': 'min',
-                    'Close': 'last',
-                    'Volume': 'sum'
-                }).dropna()
-            elif interval == 'monthly':
-                df = df.resample('M').agg({
-                    'Open': 'first',
-                    'High': 'max',
-                    'Low': 'min',
-                    'Close': 'last',
-                    'Volume': 'sum'
-                }).dropna()
-            
-            # DataFrame을 리스트로 변환
-            history_data = []
-            min_price = float('inf')
-            max_price = float('-inf')
-            
-            for index, row in df.iterrows():
-                close_price = float(row['Close'])
-                high_price = float(row['High'])
-                low_price = float(row['Low'])
-                
-                # 최고/최저가 업데이트
-                max_price = max(max_price, high_price)
-                min_price = min(min_price, low_price)
-                
-                history_data.append({
-                    'date': index.strftime('%Y-%m-%d'),
-                    'open': float(row['Open']),
-                    'high': high_price,
-                    'low': low_price,
-                    'close': close_price,
-                    'volume': int(row['Volume']) if 'Volume' in row else 0
-                })
+            # 보강했지만 새 일봉이 저장되지 않았으면(버전과 시작일이 같으면) 만들어 둔 응답 재사용
+            if cached is not None and cached[0] == (version, start_day):
+                return cached[1]
             
-            # 최고/최저 정보 추가
-            if history_data:
-                # 최고가/최저가 상위 데이터에 추가
-                for i, data in enumerate(history_data):
-                    if data['high'] == max_price:
-                        data['is_highest'] = True
-                        data['highest_date'] = data['date']
-                    if data['low'] == min_price:
-                        data['is_lowest'] = True
-                        data['lowest_date'] = data['date']
-                
-                # 첫 번째 요소에 전체 최고/최저 정보 추가
-                history_data[0]['chart_info'] = {
-                    'min_price': min_price,
-                    'max_price': max_price,
-                    'price_range': max_price - min_price
-                }
+            if not bars.shape[1]:
+                return None if fmt == 'columnar' else []
             
+            # 주간/월간 데이터는 일봉에서 집계한 뒤 열 단위로 응답 변환
+            bars = resample_bars(bars, interval)
+            history_data = bars_to_compact(bars) if fmt == 'columnar' else bars_to_records(bars)
+            
+            self.history_cache.set(cache_key, ((version, start_day), history_data))
             return history_data
             
         except Exception as e:
             logging.error(f"주식 이력 조회 실패 {symbol}: {e}")
             return []
     
-    def update_stock_cache(self):
-        """주식 캐시 업데이트 (429 에러 방지를 위한 개선)"""
+    def _daily_bars_version(self, symbol, start_day):
+        """제공자를 호출하지 않고 알 수 있는 일봉 데이터 버전 (보강이 필요하면 None)
+
+        저장소가 없으면 BAR_STORE_REFRESH초 단위 시각, 있으면 확인 주기 안이고 요청 구간을 모두 가진 경우의 파일 버전
+        """
+        if self.bar_store is None:
+            return int(time.time() // Config.BAR_STORE_REFRESH)
+        meta = self.bar_store.meta(symbol)
+        if not meta or not self.bar_store.is_fresh(symbol, meta) or start_day < meta['origin']:
+            return None
+        return self.bar_store.version(symbol)
+    
+    def get_daily_bars(self, symbol, start_date, end_date):
+        """일봉 (6, n) 배열과 데이터 버전
+
+        로컬 저장소가 있으면 memory-map 배열의 해당 구간만 읽고, 저장소에 없는 과거 구간과
+        BAR_STORE_REFRESH초가 지난 최근 구간만 제공자에서 받아 합친다.
+        버전은 새 봉이 저장될 때만 바뀌며, 저장소가 없으면 BAR_STORE_REFRESH초 단위로 바뀐다.
+        """
+        market = 'KRW' if self.is_korean_stock(symbol) else 'USD'
+        if self.bar_store is None:
+            version = self._daily_bars_version(symbol, None)
+            df = self._read_provider(market, symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+            return bars_from_frame(df), version
+        
+        start_day = float(to_days(np.datetime64(start_date.date())))
+        end_day = float(to_days(np.datetime64(end_date.date())))
+        self._bar_flight.do(symbol, lambda: self._sync_bars(symbol, market, start_day, end_day))
+        
+        # 버전을 먼저 읽어 두면 그 사이 저장된 봉은 다음 조회에서 새 버전으로 반영됨
+        version = self.bar_store.version(symbol)
+        bars = self.bar_store.slice(symbol, start_day, end_day)
+        if bars is None:
+            bars = np.empty((len(BAR_COLUMNS), 0))
+        return bars, version
+    
+    def _read_bars(self, market, symbol, start_day, end_day):
+        """제공자에서 start_day ~ end_day 일봉을 받아 저장소 배열 형식으로 변환"""
+        start, end = (str(from_days([day])[0]) for day in (start_day, end_day))
+        return bars_from_frame(self._read_provider(market, symbol, start, end))
+    
+    def _sync_bars(self, symbol, market, start_day, end_day):
+        """저장소에 없는 구간만 제공자에서 받아 저장 (실패하면 저장된 데이터로 응답)"""
+        store = self.bar_store
+        bars = store.read(symbol)
+        meta = store.meta(symbol)
         try:
-            logging.info("주식 캐시 업데이트 시작...")
-            
-            # 환율 업데이트
-            self.update_exchange_rate()
+            if bars is None or not bars.shape[1] or not meta:
+                # 처음 조회: 요청 구간과 BAR_STORE_HISTORY_DAYS 중 긴 기간을 한 번에 받음
+                origin = min(start_day, end_day - Config.BAR_STORE_HISTORY_DAYS)
+                new_bars = self._read_bars(market, symbol, origin, end_day)
+                if new_bars.shape[1]:
+                    store.merge(symbol, new_bars, origin)
+                return
             
-            all_results = {}
-            
-            # 한국 주식 처리 (주요 종목만, 더 긴 간격)
-            logging.info("한국 주식 데이터 업데이트 중...")
-            for i, symbol in enumerate(self.kr_stocks[:10]):  # 상위 10개만 자동 업데이트
-                try:
-                    if i > 0:
-                        time.sleep(random.uniform(2, 4))  # 더 긴 지연
-                    
-                    stock_data = self.get_kr_stock_info(symbol)
+            stale = not store.is_fresh(symbol, meta)
+            if start_day < meta['origin']:
+                # 저장된 구간보다 과거: 앞쪽만 보강
+                new_bars = self._read_bars(market, symbol, start_day, bars[BAR_DATE, 0] - 1)
+                store.merge(symbol, new_bars, start_day, checked=False)
+            if stale:
+                # 마지막 봉(장중이면 미완성)부터 다시 받아 뒤쪽에 추가
+                store.merge(symbol, self._read_bars(market, symbol, bars[BAR_DATE, -1], end_day))
+        except Exception as e:
+            if bars is None:
+                raise
+            logging.warning(f"일봉 보강 실패, 저장된 데이터 사용 {symbol}: {e}")
+    
+    def get_refresh_symbols(self):
+        """자동 갱신 대상 종목 목록"""
+        limit = Config.STOCK_UPDATE_SYMBOLS_PER_MARKET
+        return self.kr_stocks[:limit] + self.us_stocks[:limit]
+    
+    def _fetch_for_refresh(self, symbol):
+        """갱신 엔진 작업 단위: 한 종목 조회 (실패 시 fallback)"""
+        is_korean = self.is_korean_stock(symbol)
+        try:
+            return self.get_stock_info(symbol, use_cache=False)
+        except Exception as e:
+            logging.error(f"{'한국' if is_korean else '미국'} 주식 조회 실패 {symbol}: {e}")
+            return self.get_fallback_data(symbol, is_korean=is_korean)
+    
+    def refresh_symbols(self, symbols, max_workers=None):
+        """종목 목록을 제한된 워커 풀로 동시 조회
+
+        제공자별 속도 제한은 토큰 버킷이 담당하므로 워커 수와 무관하게
+        제공자 한도를 넘지 않음
+        """
+        results = {}
+        if not symbols:
+            return results
+        
+        workers = max(1, min(max_workers or Config.STOCK_UPDATE_WORKERS, len(symbols)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='stock-refresh')
+        pending = set()
+        try:
+            futures = {executor.submit(self._fetch_for_refresh, symbol): symbol for symbol in symbols}
+            pending = set(futures)
+            # 종료 요청을 1초 안에 알아차리도록 짧게 나눠 대기
+            while pending and not self._stop_event.is_set():
+                done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol = futures[future]
+                    try:
+                        stock_data = future.result()
+                    except Exception as e:
+                        logging.error(f"주식 갱신 작업 실패 {symbol}: {e}")
+                        continue
                     if stock_data:
-                        all_results[symbol] = stock_data
-                        
-                except Exception as e:
-                    logging.error(f"한국 주식 조회 실패 {symbol}: {e}")
-                    fallback_data = self.get_fallback_data(symbol, is_korean=True)
-                    if fallback_data:
-                        all_results[symbol] = fallback_data
+                        results[symbol] = stock_data
+        finally:
+            # 종료 요청 시 시작하지 않은 조회는 취소하고 진행 중인 조회는 기다리지 않음
+            executor.shutdown(wait=not pending, cancel_futures=bool(pending))
+        
+        return results
+    
+    def update_market_data(self):
+        """환율/지수 업데이트 및 보유 종목을 갱신 스케줄에 반영 (단계 사이에 종료 요청 확인)"""
+        self.update_exchange_rate()
+        if self._stop_event.is_set():
+            return
+        self.update_market_indices()
+        if self._stop_event.is_set():
+            return
+        
+        # 상장 종목 마스터 (하루 1회 전체 갱신)
+        listing_service.refresh_if_due(self._stop_event)
+        if self._stop_event.is_set():
+            return
+        
+        holder_counts = self._load_holder_counts()
+        if holder_counts is not None:
+            self.scheduler.set_holders(holder_counts)
+    
+    def _load_holder_counts(self):
+        """종목별 보유자 수 {symbol: count} (실패 시 None)"""
+        if not self._app:
+            return None
+        
+        try:
+            with self._app.app_context():
+                from models.portfolio import Portfolio
+                return Portfolio.count_holders()
+        except Exception as e:
+            logging.error(f"보유자 수 조회 실패: {e}")
+            return None
+    
+    def record_view(self, symbol):
+        """종목 상세 조회를 갱신 우선순위에 반영 (갱신 프로세스도 볼 수 있도록 DB에 모아서 누적)"""
+        self.scheduler.record_view(symbol)
+        if not self._app:
+            return
+        
+        with self._view_lock:
+            self._view_buffer[symbol] += 1
+            due = time.monotonic() - self._views_flushed_at >= Config.VIEW_FLUSH_INTERVAL
+            if due:
+                self._views_flushed_at = time.monotonic()
+        if due:
+            # 요청 스레드에서 DB에 쓰지 않도록 백그라운드에서 누적
+            self._revalidate_executor.submit(self.flush_views)
+    
+    def flush_views(self):
+        """모아 둔 조회수를 DB에 한 번에 누적 (실패하면 다음 주기에 다시 시도)"""
+        with self._view_lock:
+            counts, self._view_buffer = self._view_buffer, Counter()
+        if not counts or not self._app:
+            return 0
+        
+        with self._view_sync_lock:
+            try:
+                with self._app.app_context():
+                    from models.view import SymbolView
+                    SymbolView.add_views(counts)
+            except Exception as e:
+                logging.error(f"조회수 저장 실패: {e}")
+                with self._view_lock:
+                    self._view_buffer.update(counts)
+                return 0
+            self._own_views.update(counts)
+        return len(counts)
+    
+    def merge_shared_views(self):
+        """다른 프로세스가 DB에 누적한 조회수를 갱신 스케줄러에 반영 (VIEW_FLUSH_INTERVAL마다)
+
+        지난번에 읽은 누적값과의 차이만 더하고, 이 프로세스가 더한 조회수는 이미 반영했으므로 뺀다.
+        처음 읽은 누적값은 기준으로만 쓴다.
+        """
+        now = time.monotonic()
+        if not self._app or now - self._views_merge_checked < Config.VIEW_FLUSH_INTERVAL:
+            return 0
+        self._views_merge_checked = now
+        self.flush_views()
+        
+        # DB는 초 단위로 저장하므로 1초 겹쳐서 읽음 (같은 행을 다시 읽어도 차이는 0)
+        read_at = datetime.utcnow().replace(microsecond=0) - timedelta(seconds=1)
+        with self._view_sync_lock:
+            try:
+                with self._app.app_context():
+                    from models.view import SymbolView
+                    totals = SymbolView.load_totals(self._views_merged_at)
+            except Exception as e:
+                logging.error(f"조회수 로드 실패: {e}")
+                return 0
+            own, self._own_views = self._own_views, Counter()
+        
+        baseline = self._view_totals is None
+        counts = {}
+        if not baseline:
+            for symbol, total in totals.items():
+                delta = total - self._view_totals.get(symbol, 0) - own.get(symbol, 0)
+                if delta > 0:
+                    counts[symbol] = delta
+            self._view_totals.update(totals)
+        else:
+            self._view_totals = totals
+        self._views_merged_at = read_at
+        
+        if counts:
+            self.scheduler.add_views(counts)
+        return len(counts)
+    
+    def _is_market_open(self, market):
+        """시장 운영 여부 (확인할 수 없으면 열린 것으로 간주)"""
+        if not self._app:
+            return True
+        
+        try:
+            with self._app.app_context():
+                from services.market_service import MarketService
+                return MarketService.is_open_now(market)
+        except Exception as e:
+            logging.error(f"시장 운영 여부 확인 실패 {market}: {e}")
+            return True
+    
+    def _refresh_budgets(self, window):
+        """장 상태에 따른 시장별 갱신 예산 (초당 요청 수 x window초)
+
+        장이 닫힌 시장은 마감 후 종가 확정 조회 1회만 하고, 다음 개장 때 전 종목을 바로 갱신
+        """
+        now = time.monotonic()
+        budgets = {}
+        for market, limit in Config.PROVIDER_RATE_LIMITS.items():
+            session = self._market_sessions[market]
+            is_open = self._is_market_open(market)
+            was_open = session['open']
+            session['open'] = is_open
             
-            # 중간 휴식
-            time.sleep(5)
+            if is_open:
+                if was_open is False:
+                    logging.info(f"{market} 시장 개장: 갱신 재개")
+                    self.scheduler.reschedule_market(market)
+                session['settle_at'] = None
+                session['settling'] = False
+                budgets[market] = max(1, int(limit['rate'] * window))
+                continue
             
-            # 미국 주식 처리 (주요 종목만, 훨씬 더 긴 간격)
-            logging.info("미국 주식 데이터 업데이트 중...")
-            for i, symbol in enumerate(self.us_stocks[:10]):  # 상위 10개만 자동 업데이트
-                try:
-                    if i > 0:
-                        time.sleep(random.uniform(4, 8))  # 훨씬 더 긴 지연
-                    
-                    stock_data = self.get_us_stock_info(symbol)
-                    if stock_data:
-                        all_results[symbol] = stock_data
-                        
-                except Exception as e:
-                    logging.error(f"미국 주식 조회 실패 {symbol}: {e}")
-                    fallback_data = self.get_fallback_data(symbol, is_korean=False)
-                    if fallback_data:
-                        all_results[symbol] = fallback_data
+            if was_open is not False:
+                # 장 마감 직후(마감 중 부팅이면 즉시) 종가 확정 조회 예약
+                delay = Config.MARKET_SETTLE_DELAY if was_open else 0
+                session['settle_at'] = now + delay
+                logging.info(f"{market} 시장 마감: {delay}초 후 종가 확정 조회")
             
-            # 메모리 캐시 업데이트
-            self.stock_cache.update(all_results)
+            if session['settle_at'] is not None and now >= session['settle_at']:
+                self.scheduler.reschedule_market(market)
+                session['settle_at'] = None
+                session['settling'] = True
             
-            # MySQL에 저장
-            for symbol, data in all_results.items():
-                self._save_to_db(symbol, data)
+            if session['settling']:
+                if self.scheduler.has_due(market):
+                    budgets[market] = max(1, int(limit['rate'] * window))
+                else:
+                    session['settling'] = False
+                    logging.info(f"{market} 종가 확정 완료: 다음 개장까지 갱신 중지")
+        
+        return budgets
+    
+    def refresh_scheduled(self, window):
+        """갱신 시각이 된 종목을 점수 순으로 조회 (장이 열린 시장만, 시장별 예산 안에서)"""
+        budgets = self._refresh_budgets(window)
+        if not budgets:
+            return {}
+        symbols = self.scheduler.due(budgets)
+        if not symbols:
+            return {}
+        
+        started = time.monotonic()
+        results = {}
+        try:
+            results = self.refresh_symbols(symbols)
             
-            logging.info(f"주식 캐시 업데이트 완료: {len(all_results)}개 종목")
+            # 메모리 캐시(및 공유 보드) 업데이트
+            self._publish_quotes(results)
+            
+            # MySQL에 일괄 저장
+            self._save_many_to_db(results)
+        finally:
+            for symbol in symbols:
+                self.scheduler.complete(symbol, results.get(symbol))
         
+        logging.info(f"예약 갱신 완료: {len(results)}/{len(symbols)}개 종목 ({time.monotonic() - started:.1f}초)")
+        return results
+    
+    def update_stock_cache(self):
+        """주식 캐시 업데이트 (환율/지수 + 갱신 시각이 된 종목)"""
+        try:
+            logging.info("주식 캐시 업데이트 시작...")
+            self.update_market_data()
+            self.refresh_scheduled(Config.REFRESH_SCHEDULER['tick'])
         except Exception as e:
             logging.error(f"주식 캐시 업데이트 실패: {e}")
     
-    def get_multiple_stocks(self, symbols):
-        """여러 주식 정보 한번에 조회"""
-        results = []
-        for i, symbol in enumerate(symbols):
-            if i > 0:
-                time.sleep(random.uniform(1, 3))  # 요청 간 지연
-            
-            stock_data = self.get_cached_stock_data(symbol)
-            if not stock_data:
-                stock_data = self.get_stock_info(symbol)
-            if stock_data:
-                results.append(stock_data)
-        return results
+    def warm_start(self):
+        """부팅 시 stocks 테이블 전체를 한 번의 쿼리로 메모리 캐시에 적재
+
+        각 시세는 DB의 updated_at을 그대로 유지하므로 나이(age)가 보존되고,
+        이후 갱신 주기에서는 오래된 종목만 다시 조회됨
+        """
+        if not self._app or self._is_shared_reader():
+            # reader 워커는 공유 보드를 읽으므로 자체 적재하지 않음
+            return 0
+        
+        quotes = self._load_all_from_db()
+        if quotes is None:
+            return 0
+        
+        # 이미 갱신된 값은 덮어쓰지 않음
+        missing = {symbol: data for symbol, data in quotes.items() if symbol not in self.stock_cache}
+        self._publish_quotes(missing)
+        
+        # 기본 종목은 남은 주기만큼 늦게 조회 (방금 저장된 시세는 다시 조회하지 않음)
+        for symbol in self.get_refresh_symbols():
+            if symbol in quotes:
+                self.scheduler.track(symbol, age=self._quote_age(quotes[symbol]))
+        
+        logging.info(f"캐시 웜스타트 완료: {len(quotes)}개 종목")
+        return len(quotes)
+    
+    def sync_from_db(self):
+        """리더가 아닌 프로세스: 리더가 DB에 저장한 시세 중 메모리보다 최신인 것만 반영"""
+        listing_service.load_if_changed()
+        
+        quotes = self._load_all_from_db()
+        if not quotes:
+            return 0
+        
+        newer = {}
+        for symbol, stock_data in quotes.items():
+            current = self.stock_cache.get(symbol)
+            if current is None or self._quote_timestamp(stock_data) > self._quote_timestamp(current):
+                newer[symbol] = stock_data
+        self._publish_quotes(newer)
+        return len(newer)
+    
+    def _load_all_from_db(self):
+        """stocks 테이블 전체를 한 번의 쿼리로 로드 (실패 시 None)"""
+        if not self._app:
+            return None
+        
+        try:
+            with self._app.app_context():
+                from models.stock import Stock
+                return {row.symbol: row.to_dict() for row in Stock.query.all()}
+        except Exception as e:
+            logging.error(f"DB 시세 로드 실패: {e}")
+            return None
+    
+    def get_multiple_stocks(self, symbols, deadline=None):
+        """여러 주식 정보 한번에 조회
+
+        캐시된 종목은 바로 반환하고, 없는 종목만 갱신 작업 풀(제공자별 요청 제한 적용)에서 병렬 조회해
+        deadline(초)까지 기다림. 반환: (시세 목록, {symbol: quote_status})
+        """
+        deadline = Config.MULTIPLE_QUOTE_DEADLINE if deadline is None else deadline
+        symbols = list(dict.fromkeys(symbols))  # 중복 제거 (순서 유지)
+        results = self._attach_quotes([{'symbol': symbol} for symbol in symbols], fetch=True, deadline=deadline)
+        
+        stocks, statuses = [], {}
+        for result in results:
+            status = result.pop('quote_status')
+            statuses[result['symbol']] = status
+            if status in QUOTE_FOUND:
+                stocks.append(result)
+        return stocks, statuses
     
     def get_cached_stock_data(self, symbol):
         """캐시된 주식 데이터 조회"""
         # 메모리 캐시 먼저 확인
-        if symbol in self.stock_cache:
-            return self.stock_cache[symbol]
+        stock_data = self._get_memory_quote(symbol)
+        if stock_data:
+            return stock_data
+        
+        # 조회 캐시 (자동 갱신 대상 외 종목)
+        cached_data = self.quote_cache.get(symbol)
+        if cached_data:
+            return cached_data
         
         # MySQL 캐시 확인
         cached_data = self._load_from_db(symbol)
         if cached_data:
-            return cached_data
+            # DB 갱신 시각 기준으로 TTL 적용
+            return self._store_quote(symbol, cached_data)
         
         return None
     
-    def get_cached_price(self, symbol):
-        """캐시된 주식 가격 조회"""
-        stock_data = self.get_cached_stock_data(symbol)
+    def get_quote(self, symbol, soft_ttl=None, deadline=None):
+        """신선도 기반 시세 조회 (stale-while-revalidate)
+
+        마지막으로 알려진 시세를 즉시 반환하고, soft_ttl(초)이 지났으면 백그라운드 갱신을 예약.
+        값이 전혀 없을 때만 deadline(초)까지 조회를 기다림.
+        반환: (stock_data, 시세 나이(초) 또는 None) - 값을 얻지 못하면 (None, None)
+        """
+        soft_ttl = Config.QUOTE_SOFT_TTL if soft_ttl is None else soft_ttl
+        deadline = Config.QUOTE_FETCH_DEADLINE if deadline is None else deadline
+        
+        # 존재하지 않는 것으로 확인된 종목은 즉시 실패
+        if self.is_known_missing(symbol):
+            return None, None
+        
+        stock_data = self._get_last_known(symbol)
         if stock_data:
-            return stock_data.get('current_price', 0)
+            age = self._quote_age(stock_data)
+            # 공유 보드/수집 프로세스가 갱신하는 종목은 워커에서 다시 조회하지 않음
+            if (age is None or age > soft_ttl) and not self._served_by_updater(symbol, age):
+                self._schedule_revalidate(symbol)
+            return stock_data, age
+        
+        # 값이 없으면 조회를 예약하고 deadline까지만 대기 (조회는 백그라운드에서 계속됨)
+        future = self._schedule_revalidate(symbol)
+        try:
+            stock_data = future.result(timeout=deadline)
+        except FuturesTimeoutError:
+            logging.warning(f"시세 조회 대기 시간 초과 {symbol} ({deadline}초)")
+            return None, None
+        except Exception as e:
+            logging.error(f"시세 조회 실패 {symbol}: {e}")
+            return None, None
+        
+        if not stock_data:
+            return None, None
+        return stock_data, self._quote_age(stock_data)
+    
+    def _get_last_known(self, symbol):
+        """신선도와 관계없이 마지막으로 알려진 시세 (메모리 → 조회 캐시 → DB)"""
+        stock_data = self._get_memory_quote(symbol)
+        if stock_data:
+            return stock_data
+        
+        entry = self.quote_cache.peek(symbol)
+        if entry:
+            return entry[0]
+        
+        stock_data = self._load_from_db(symbol)
+        if stock_data:
+            stock_data = self._store_quote(symbol, stock_data)
+        return stock_data
+    
+    def _served_by_updater(self, symbol, age):
+        """다른 프로세스(리더/수집 프로세스/공유 보드 writer)가 갱신 중인 종목인지 확인
+
+        갱신 프로세스는 스케줄에 있는 종목(기본 종목, 보유/조회 종목)만 갱신하므로, 이 프로세스에서도
+        스케줄에 있고 시세가 UPDATER_REFRESH_HORIZON 안에 갱신된 종목만 맡긴다. 그 밖의 종목은
+        아무도 갱신하지 않으므로 워커가 직접 백그라운드 갱신한다.
+        """
+        if self.read_only or (self.leader is not None and not self.leader.is_leader):
+            # DB 동기화로 받는 종목
+            updated_elsewhere = symbol in self.stock_cache
+        else:
+            updated_elsewhere = self._is_shared_reader() and symbol not in self.stock_cache and symbol in self.shared_board
+        if not updated_elsewhere or symbol not in self.scheduler:
+            return False
+        return age is not None and age <= Config.UPDATER_REFRESH_HORIZON
+    
+    def _quote_age(self, stock_data):
+        """시세 나이(초) - updated_at(UTC) 기준, 알 수 없으면 None"""
+        updated_at = stock_data.get('updated_at')
+        if not isinstance(updated_at, datetime):
+            return None
+        return max(0.0, (datetime.utcnow() - updated_at).total_seconds())
+    
+    def _schedule_revalidate(self, symbol):
+        """백그라운드 갱신 예약 (종목당 1건만 진행)"""
+        with self._revalidate_lock:
+            future = self._revalidating.get(symbol)
+            if future is not None and not future.done():
+                return future
+            future = self._revalidate_executor.submit(self._revalidate, symbol)
+            self._revalidating[symbol] = future
+        
+        def _done(f, symbol=symbol):
+            with self._revalidate_lock:
+                if self._revalidating.get(symbol) is f:
+                    del self._revalidating[symbol]
+        
+        future.add_done_callback(_done)
+        return future
+    
+    def _revalidate(self, symbol):
+        """제공자에서 새 시세를 가져와 캐시 갱신"""
+        stock_data = self.get_stock_info(symbol, use_cache=False)
+        if stock_data and symbol in self.stock_cache:
+            self._publish_quotes({symbol: stock_data})
+        return stock_data
+    
+    def get_krw_prices(self, symbols):
+        """여러 종목의 원화 환산 현재가 {symbol: price}
+
+        시세 보드에 있는 종목은 배열 연산으로 한 번에 읽고, 나머지만 종목별로 조회
+        """
+        symbols = list(symbols)
+        prices = {}
+        board = self.stock_cache.snapshot().board
+        for symbol, price in zip(symbols, board.krw_prices(symbols).tolist()):
+            if price == price:  # NaN이 아니면 보드에 있는 종목
+                prices[symbol] = price
+        
+        for symbol in symbols:
+            if symbol in prices:
+                continue
+            stock_data, _ = self.get_quote(symbol)
+            if not stock_data:
+                continue
+            current_price = stock_data['current_price']
+            if stock_data.get('currency') == 'USD' and stock_data.get('exchange_rate'):
+                current_price = current_price * stock_data['exchange_rate']
+            prices[symbol] = current_price
         
-        # 캐시에 없으면 새로 조회
-        stock_data = self.get_stock_info(symbol)
+        return prices
+    
+    def get_cached_price(self, symbol):
+        """캐시된 주식 가격 조회"""
+        stock_data, _ = self.get_quote(symbol)
         if stock_data:
             return stock_data.get('current_price', 0)
         
         return 0
     
     def get_market_indices(self):
+        """주요 시장 지수 정보 (MARKET_DATA_TTL 동안 캐시, 읽기 전용 모드는 저장된 스냅샷)"""
+        indices = self._read_market_snapshot('market_indices') if self.read_only else self.market_data.get('market_indices')
+        if indices:
+            return indices
+        return self.update_market_indices()
+    
+    def update_market_indices(self):
+        """시장 지수를 조회해 스냅샷으로 저장"""
+        indices = self._fetch_market_indices()
+        self._save_market_snapshot('market_indices', indices)
+        return indices
+    
+    def _fetch_market_indices(self):
         """주요 시장 지수 정보 조회"""
         indices = []
         
@@ -803,20 +1645,13 @@ class StockService:
     
     def get_market_summary(self):
         """시장 요약 정보"""
-        kr_stocks_data = []
-        us_stocks_data = []
+        kr_symbols = self.kr_stocks[:10]  # 주요 한국 주식 10개
+        us_symbols = self.us_stocks[:10]  # 주요 미국 주식 10개
         
-        # 주요 한국 주식 10개
-        for symbol in self.kr_stocks[:10]:
-            data = self.get_cached_stock_data(symbol)
-            if data:
-                kr_stocks_data.append(data)
-        
-        # 주요 미국 주식 10개
-        for symbol in self.us_stocks[:10]:
-            data = self.get_cached_stock_data(symbol)
-            if data:
-                us_stocks_data.append(data)
+        # 같은 시점의 스냅샷에서 시세 보드 배열을 한 번에 읽고, 보드에 없는 종목만 종목별로 조회
+        quotes = self.stock_cache.snapshot().get_many(kr_symbols + us_symbols)
+        kr_stocks_data = [data for data in (quotes.get(s) or self.get_cached_stock_data(s) for s in kr_symbols) if data]
+        us_stocks_data = [data for data in (quotes.get(s) or self.get_cached_stock_data(s) for s in us_symbols) if data]
         
         return {
             'korean_market': kr_stocks_data,
@@ -832,15 +1667,39 @@ class StockService:
             return
         
         self.is_running = True
+        self._stop_event.clear()
+        if self.leader:
+            self.leader.start()
+        
+        # 스케줄러 틱마다 깨어나 갱신 시각이 된 종목만 조회 (리더 교체도 이 주기로 반영)
+        tick = min(interval, Config.REFRESH_SCHEDULER['tick'])
+        if self.leader:
+            tick = min(tick, self.leader.heartbeat_seconds)
         
         def update_loop():
+            next_run = 0.0
+            was_leader = False
             while self.is_running:
+                is_leader = self.is_updater_leader()
+                now = time.monotonic()
                 try:
-                    self.update_stock_cache()
-                    time.sleep(interval)
+                    if is_leader:
+                        # 환율/지수/보유 종목은 interval마다, 새로 리더가 되면 바로 갱신
+                        if now >= next_run or not was_leader:
+                            next_run = now + interval
+                            self.update_market_data()
+                        # 웹 워커들의 조회수를 갱신 우선순위에 반영
+                        self.merge_shared_views()
+                        self.refresh_scheduled(tick)
+                    elif now >= next_run:
+                        # 리더가 아니면 제공자를 호출하지 않고 리더가 저장한 시세만 반영
+                        next_run = now + interval
+                        self.sync_from_db()
                 except Exception as e:
                     logging.error(f"자동 업데이트 에러: {e}")
-                    time.sleep(interval)
+                was_leader = is_leader
+                # 종료 요청 시 즉시 깨어남
+                self._stop_event.wait(tick)
         
         self.update_thread = threading.Thread(target=update_loop, daemon=True)
         self.update_thread.start()
@@ -849,8 +1708,16 @@ class StockService:
     def stop_auto_update(self):
         """자동 업데이트 중지"""
         self.is_running = False
+        self._stop_event.set()
         if self.update_thread:
-            self.update_thread.join()
+            # 진행 중인 제공자 호출 1건은 끝까지 기다릴 수 없으므로 최대 UPDATER_STOP_TIMEOUT초만 대기 (데몬 스레드)
+            self.update_thread.join(Config.UPDATER_STOP_TIMEOUT)
+            if self.update_thread.is_alive():
+                logging.warning(f"자동 업데이트 스레드가 {Config.UPDATER_STOP_TIMEOUT}초 안에 끝나지 않아 기다리지 않고 종료")
+            self.update_thread = None
+        if self.leader:
+            self.leader.stop()
+        self.flush_views()
         logging.info("주식 자동 업데이트 중지")
 
 # 전역 주식 서비스 인스턴스
@@ -0,0 +1,217 @@
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import quote
+
+import numpy as np
+
+from utils.ttl_cache import TTLCache
+
+# 열 순서 (date는 1970-01-01 기준 일수)
+COLUMNS = ('date', 'open', 'high', 'low', 'close', 'volume')
+DATE, OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(COLUMNS))
+
+
+def to_days(values):
+    """datetime64/DatetimeIndex -> 일수 배열 (float64)"""
+    return np.asarray(values, dtype='datetime64[D]').astype(np.int64).astype(np.float64)
+
+
+def from_days(days):
+    """일수 배열 -> datetime64[D] 배열"""
+    return np.asarray(days, dtype=np.int64).astype('datetime64[D]')
+
+
+def bars_from_frame(df):
+    """OHLCV DataFrame -> (6, n) 열 우선 배열"""
+    bars = np.empty((len(COLUMNS), len(df)), dtype=np.float64)
+    bars[DATE] = to_days(df.index.values)
+    for i, name in enumerate(('Open', 'High', 'Low', 'Close', 'Volume'), start=OPEN):
+        if name in df.columns:
+            bars[i] = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            bars[i] = 0.0
+    bars[VOLUME] = np.nan_to_num(bars[VOLUME])
+    # 종가가 없는 행(거래 정지 등)은 제외
+    return bars[:, ~np.isnan(bars[CLOSE])]
+
+
+def resample_bars(bars, interval):
+    """일봉 -> 주봉(weekly, 일요일 날짜) / 월봉(monthly, 말일 날짜)
+
+    날짜가 정렬되어 있으므로 구간 경계만 찾고 reduceat으로 한 번에 집계한다.
+    """
+    if interval not in ('weekly', 'monthly') or not bars.shape[1]:
+        return bars
+
+    days = bars[DATE].astype(np.int64)
+    if interval == 'weekly':
+        # 1970-01-01은 목요일 -> (일수 + 3) // 7이 같으면 같은 주(월~일)
+        groups = (days + 3) // 7
+    else:
+        groups = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+
+    starts = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+    ends = np.append(starts[1:], len(days)) - 1
+
+    out = np.empty((len(COLUMNS), len(starts)), dtype=np.float64)
+    if interval == 'weekly':
+        out[DATE] = groups[starts] * 7 + 3
+    else:
+        months = groups[starts].astype('datetime64[M]')
+        out[DATE] = to_days((months + 1).astype('datetime64[D]') - 1)
+    out[OPEN] = bars[OPEN][starts]
+    out[HIGH] = np.maximum.reduceat(bars[HIGH], starts)
+    out[LOW] = np.minimum.reduceat(bars[LOW], starts)
+    out[CLOSE] = bars[CLOSE][ends]
+    out[VOLUME] = np.add.reduceat(bars[VOLUME], starts)
+    return out[:, ~np.isnan(out).any(axis=0)]
+
+
+class BarStore:
+    """종목별 일봉 저장소 (로컬 디스크, 열 우선 .npy + memory-map 읽기)
+
+    종목마다 (6, n) float64 배열 하나를 저장하므로 각 열이 연속된 메모리에 있어
+    날짜 범위 조회는 이진 탐색 후 복사 없는 슬라이스로 끝난다.
+    새 봉을 붙일 때는 임시 파일에 쓰고 os.replace로 교체하므로 이미 열린 배열을 읽는 쪽은 영향이 없다.
+    옆의 .json에는 조회를 시작한 날짜(origin)와 마지막 확인 시각(checked_at)을 둔다.
+    """
+
+    def __init__(self, root, refresh_seconds=900, max_open=256):
+        self.root = root
+        self.refresh_seconds = refresh_seconds
+        self._arrays = TTLCache(max_open, 24 * 3600)  # symbol -> (mtime_ns, memmap)
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.writes = 0
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, symbol, ext):
+        return os.path.join(self.root, quote(symbol, safe='') + ext)
+
+    # ----- 메타데이터 -----
+    def meta(self, symbol):
+        """{'origin': 일수, 'checked_at': epoch 초} (없으면 None)"""
+        try:
+            with open(self._path(symbol, '.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, symbol, meta):
+        path = self._path(symbol, '.json')
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, path)
+
+    def is_fresh(self, symbol, meta=None):
+        meta = meta if meta is not None else self.meta(symbol)
+        return bool(meta) and time.time() - meta.get('checked_at', 0) < self.refresh_seconds
+
+    # ----- 읽기 -----
+    def read(self, symbol):
+        """전체 일봉 (6, n) 읽기 전용 memmap (없으면 None)"""
+        path = self._path(symbol, '.npy')
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._arrays.get(symbol)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            bars = np.load(path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logging.error(f"일봉 파일 읽기 실패 {symbol}: {e}")
+            return None
+        self._arrays.set(symbol, (mtime_ns, bars))
+        self.reads += 1
+        return bars
+
+    def version(self, symbol):
+        """일봉 파일 버전 (새 봉이 저장될 때만 바뀜, 없으면 None)"""
+        try:
+            return os.stat(self._path(symbol, '.npy')).st_mtime_ns
+        except OSError:
+            return None
+
+    def slice(self, symbol, start_day=None, end_day=None):
+        """start_day <= date <= end_day 구간 (복사 없는 view, 없으면 None)"""
+        bars = self.read(symbol)
+        if bars is None:
+            return None
+        dates = bars[DATE]
+        i = 0 if start_day is None else int(np.searchsorted(dates, start_day, side='left'))
+        j = len(dates) if end_day is None else int(np.searchsorted(dates, end_day, side='right'))
+        return bars[:, i:j]
+
+    # ----- 쓰기 -----
+    def write(self, symbol, bars, origin, checked_at=None):
+        """전체 일봉 교체 (임시 파일에 쓴 뒤 원자적 교체)"""
+        path = self._path(symbol, '.npy')
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            np.save(f, np.ascontiguousarray(bars, dtype=np.float64))
+        os.replace(tmp, path)
+        self._write_meta(symbol, {
+            'origin': float(origin),
+            'checked_at': time.time() if checked_at is None else checked_at
+        })
+        self.writes += 1
+
+    def merge(self, symbol, new_bars, origin=None, checked=True):
+        """새 봉을 기존 봉과 합쳐 저장 (같은 날짜는 새 값으로 교체)
+
+        앞쪽(과거) 보강과 뒤쪽(최근) 추가를 모두 처리한다. checked=False면(과거 보강)
+        최근 봉 확인 시각은 그대로 둔다. 반환: 저장된 봉 수
+        """
+        with self._lock:
+            current = self.read(symbol)
+            meta = self.meta(symbol) or {}
+            origins = [v for v in (origin, meta.get('origin')) if v is not None]
+
+            if current is not None and current.shape[1]:
+                if not new_bars.shape[1] or self._unchanged(current, new_bars):
+                    # 새 봉이 없으면(휴장일 등) 파일은 그대로 두고 확인 시각만 갱신
+                    if checked:
+                        meta['checked_at'] = time.time()
+                    if origins:
+                        meta['origin'] = float(min(origins))
+                    self._write_meta(symbol, meta)
+                    return current.shape[1]
+                dates = current[DATE]
+                merged = np.concatenate([
+                    current[:, dates < new_bars[DATE, 0]],
+                    new_bars,
+                    current[:, dates > new_bars[DATE, -1]],
+                ], axis=1)
+            else:
+                merged = new_bars
+
+            if not origins:
+                origins = [merged[DATE, 0]] if merged.shape[1] else [0.0]
+            self.write(symbol, merged, min(origins), None if checked else meta.get('checked_at', 0))
+            return merged.shape[1]
+
+    @staticmethod
+    def _unchanged(current, new_bars):
+        """new_bars가 이미 저장된 봉과 같은지 확인 (같으면 파일을 다시 쓰지 않음)"""
+        dates = current[DATE]
+        i = int(np.searchsorted(dates, new_bars[DATE, 0]))
+        j = i + new_bars.shape[1]
+        if i == len(dates) or j > len(dates):
+            return False
+        return np.array_equal(current[:, i:j], new_bars, equal_nan=True)
+
+    def get_stats(self):
+        return {
+            'root': self.root,
+            'open_arrays': len(self._arrays),
+            'reads': self.reads,
+            'writes': self.writes
+        }
@@ -0,0 +1,152 @@
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 요청이 거부됨"""
+
+
+def http_status(error):
+    """예외에 담긴 HTTP 상태 코드 (requests/urllib HTTPError, 없으면 None)"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    if status is None:
+        status = getattr(error, 'code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_not_found(error):
+    """제공자가 종목 없음(404)으로 응답했는지 여부"""
+    return http_status(error) == 404
+
+
+def is_transport_error(error):
+    """응답을 받지 못한 오류 (연결/시간 초과 등, 응답 해석 오류는 제외)"""
+    if http_status(error) is not None or isinstance(error, ValueError):
+        return False
+    # requests/urllib의 연결/시간 초과 오류는 모두 OSError 하위 클래스
+    return isinstance(error, OSError)
+
+
+def is_provider_failure(error):
+    """제공자 호출에서 난 예외가 제공자 장애인지 여부
+
+    요청 자체의 오류(429를 제외한 4xx)만 빼고 전송 오류, 5xx/429, 응답 해석 오류는 모두 장애로 센다
+    (요청 제한에 걸리면 HTML 오류 페이지가 와서 ValueError 등 해석 오류로 나타나는 경우가 많음).
+    종목 없음 판단은 is_not_found로 따로 한다.
+    """
+    status = http_status(error)
+    if status is not None:
+        return status >= 500 or status == 429
+    return True
+
+
+class CircuitBreaker:
+    """데이터 제공자용 서킷 브레이커 (closed / open / half_open)
+
+    - closed: 최근 window건 중 실패율이 failure_rate 이상이면(최소 min_calls건) open으로 전환
+    - open: open_seconds 동안 요청을 즉시 거부
+    - half_open: half_open_calls건의 시험 요청만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    def __init__(self, name, failure_rate=0.5, window=20, min_calls=5,
+                 open_seconds=30, half_open_calls=1, history_size=50):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._results = deque(maxlen=window)  # True=성공, False=실패
+        self._state = CLOSED
+        self._opened_at = None
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.transitions = deque(maxlen=history_size)
+
+    @property
+    def state(self):
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _transition(self, new_state):
+        old_state = self._state
+        self._state = new_state
+        self.transitions.append({
+            'from': old_state,
+            'to': new_state,
+            'at': datetime.utcnow().isoformat()
+        })
+        logging.warning(f"서킷 브레이커 [{self.name}] {old_state} → {new_state}")
+
+    def _maybe_half_open(self, now):
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._half_open_in_flight = 0
+            self._transition(HALF_OPEN)
+
+    def _open(self, now):
+        self._opened_at = now
+        self._results.clear()
+        self._transition(OPEN)
+
+    def allow_request(self):
+        """요청 허용 여부 (open이면 즉시 False)"""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._half_open_in_flight < self.half_open_calls:
+                self._half_open_in_flight += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._results.clear()
+                self._transition(CLOSED)
+            self._results.append(True)
+
+    def release(self):
+        """결과를 기록하지 않고 요청 종료 (제공자 장애가 아닌 오류 - half-open 시험 요청 슬롯만 반환)"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._open(now)
+                return
+            if self._state == OPEN:
+                return
+            self._results.append(False)
+            calls = len(self._results)
+            failures = calls - sum(self._results)
+            if calls >= self.min_calls and failures / calls >= self.failure_rate:
+                self._open(now)
+
+    def get_stats(self):
+        """브레이커 상태 (모니터링용)"""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            calls = len(self._results)
+            failures = calls - sum(self._results)
+            return {
+                'state': self._state,
+                'recent_calls': calls,
+                'recent_failures': failures,
+                'failure_rate': round(failures / calls, 4) if calls else 0,
+                'rejected': self.rejected,
+                'transitions': list(self.transitions)
+            }
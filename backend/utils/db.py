@@ -44,6 +44,37 @@ def init_db(app):
         db.create_all()
         logging.info("MySQL 데이터베이스 테이블 생성 완료")
 
+def upsert_rows(table, rows, update, key='symbol', chunk_size=500):
+    """여러 행 일괄 upsert (지원하지 않는 DB면 아무것도 하지 않고 False)
+
+    MySQL은 INSERT ... ON DUPLICATE KEY UPDATE, SQLite는 INSERT ... ON CONFLICT DO UPDATE를
+    chunk_size건씩 실행하고 마지막에 한 번만 커밋한다 (실패하면 롤백 후 예외 전달).
+    update: 갱신할 열 이름 목록, 또는 새 값(inserted/excluded)을 받아 {열: 값}을 반환하는 함수
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return False
+    
+    try:
+        for i in range(0, len(rows), chunk_size):
+            stmt = insert(table).values(rows[i:i + chunk_size])
+            new = stmt.inserted if dialect == 'mysql' else stmt.excluded
+            values = update(new) if callable(update) else {col: new[col] for col in update}
+            if dialect == 'mysql':
+                stmt = stmt.on_duplicate_key_update(values)
+            else:
+                stmt = stmt.on_conflict_do_update(index_elements=[key], set_=values)
+            db.session.execute(stmt)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return True
+
 def close_db():
     """DB 연결 종료"""
     global _engine, _session_factory
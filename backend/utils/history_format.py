@@ -0,0 +1,159 @@
+import numpy as np
+
+from utils.bar_store import DATE, OPEN, HIGH, LOW, CLOSE, VOLUME, from_days
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성 (format=msgpack 응답에만 사용)
+    msgpack = None
+
+RECORD_KEYS = ('date', 'open', 'high', 'low', 'close', 'volume')
+
+# 차트 응답 형식: json(기본, 봉별 dict 목록), columnar(압축 열 형식), msgpack(columnar를 MessagePack으로)
+HISTORY_FORMATS = ('json', 'columnar') + (('msgpack',) if msgpack is not None else ())
+
+COLUMNAR_VERSION = 1
+MAX_PRICE_DECIMALS = 4
+
+# 응답 객체의 봉당 메모리 (측정값, 캐시 크기 예산용 추정치)
+RECORD_BYTES = 480    # json: 봉별 dict
+COLUMNAR_BYTES = 220  # columnar: 열별 정수 목록
+
+
+def format_days(days):
+    """일수 배열 -> 'YYYY-MM-DD' 문자열 목록 (한 번에 변환)"""
+    return np.datetime_as_string(from_days(days), unit='D').tolist()
+
+
+def frame_columns(df):
+    """OHLCV DataFrame -> (open, high, low, close, volume) float64 배열"""
+    columns = []
+    for name in ('Open', 'High', 'Low', 'Close', 'Volume'):
+        if name in df.columns:
+            columns.append(df[name].to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            columns.append(np.zeros(len(df)))
+    return columns
+
+
+def history_records(dates, opens, highs, lows, closes, volumes, mark_extremes=True):
+    """열 배열 -> 차트 응답 목록 [{'date', 'open', 'high', 'low', 'close', 'volume'}]
+
+    행마다 pandas 객체를 만들지 않고 열 단위로 파이썬 값으로 변환한 뒤 묶는다.
+    mark_extremes면 최고가/최저가 봉에 is_highest/is_lowest를, 첫 봉에 chart_info를 추가한다.
+    """
+    if not len(dates):
+        return []
+
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    volumes = np.nan_to_num(np.asarray(volumes, dtype=np.float64)).astype(np.int64)
+    records = [
+        dict(zip(RECORD_KEYS, row))
+        for row in zip(dates, np.asarray(opens, dtype=np.float64).tolist(), highs.tolist(), lows.tolist(),
+                       np.asarray(closes, dtype=np.float64).tolist(), volumes.tolist())
+    ]
+    if not mark_extremes:
+        return records
+
+    # 최고/최저는 배열 연산으로 계산
+    max_price = float(np.nanmax(highs))
+    min_price = float(np.nanmin(lows))
+    for i in np.flatnonzero(highs == max_price).tolist():
+        records[i]['is_highest'] = True
+        records[i]['highest_date'] = records[i]['date']
+    for i in np.flatnonzero(lows == min_price).tolist():
+        records[i]['is_lowest'] = True
+        records[i]['lowest_date'] = records[i]['date']
+
+    records[0]['chart_info'] = {
+        'min_price': min_price,
+        'max_price': max_price,
+        'price_range': max_price - min_price
+    }
+    return records
+
+
+def bars_to_records(bars):
+    """저장소 일봉/집계 배열 (6, n) -> 차트 응답 목록"""
+    return history_records(
+        format_days(bars[DATE]), bars[OPEN], bars[HIGH], bars[LOW], bars[CLOSE], bars[VOLUME]
+    )
+
+
+def history_nbytes(history_data):
+    """차트 응답이 차지하는 메모리 추정치 (바이트)"""
+    if isinstance(history_data, dict):
+        return 512 + history_data.get('count', 0) * COLUMNAR_BYTES
+    return 64 + len(history_data or ()) * RECORD_BYTES
+
+
+def price_decimals(*columns):
+    """가격을 정수로 바꿀 소수 자릿수 (모든 값을 그대로 나타내는 가장 작은 자릿수, 최대 MAX_PRICE_DECIMALS)"""
+    values = np.concatenate([np.asarray(column, dtype=np.float64) for column in columns])
+    values = values[np.isfinite(values)]
+    for decimals in range(MAX_PRICE_DECIMALS):
+        scaled = values * 10 ** decimals
+        if np.allclose(scaled, np.round(scaled), rtol=0, atol=1e-6):
+            return decimals
+    return MAX_PRICE_DECIMALS
+
+
+def compact_history(times, opens, highs, lows, closes, volumes, time_unit='day'):
+    """열 배열 -> 압축 열 형식 (정수 델타 인코딩, 데이터가 없으면 None)
+
+    times는 1970-01-01 00:00 기준 정수(time_unit: day 또는 minute, 분봉은 거래소 현지 시각).
+    가격은 정수 = round(가격 * 10**decimals)로 바꾼 뒤
+      time, close: [첫 값, 이후 이전 값과의 차이...]
+      open, high, low: 같은 봉 종가와의 차이
+    로 보낸다. 복원: time = cumsum(time), close = cumsum(close), open = close + open,
+    가격 = 정수 / 10**decimals
+    """
+    if not len(times):
+        return None
+
+    decimals = price_decimals(opens, highs, lows, closes)
+    scale = 10 ** decimals
+
+    def to_ints(values):
+        return np.round(np.nan_to_num(np.asarray(values, dtype=np.float64)) * scale).astype(np.int64)
+
+    close = to_ints(closes)
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    max_price = float(np.nanmax(highs))
+    min_price = float(np.nanmin(lows))
+    return {
+        'format': 'columnar',
+        'version': COLUMNAR_VERSION,
+        'count': len(times),
+        'time_unit': time_unit,
+        'decimals': decimals,
+        'time': np.diff(np.asarray(times, dtype=np.int64), prepend=0).tolist(),
+        'close': np.diff(close, prepend=0).tolist(),
+        'open': (to_ints(opens) - close).tolist(),
+        'high': (to_ints(highs) - close).tolist(),
+        'low': (to_ints(lows) - close).tolist(),
+        'volume': np.nan_to_num(np.asarray(volumes, dtype=np.float64)).astype(np.int64).tolist(),
+        'highest_index': int(np.nanargmax(highs)),
+        'lowest_index': int(np.nanargmin(lows)),
+        'chart_info': {
+            'min_price': min_price,
+            'max_price': max_price,
+            'price_range': max_price - min_price
+        }
+    }
+
+
+def bars_to_compact(bars):
+    """저장소 일봉/집계 배열 (6, n) -> 압축 열 형식"""
+    return compact_history(
+        bars[DATE].astype(np.int64), bars[OPEN], bars[HIGH], bars[LOW], bars[CLOSE], bars[VOLUME]
+    )
+
+
+def pack_msgpack(payload):
+    """응답을 MessagePack 바이트로 변환 (msgpack 미설치 시 RuntimeError)"""
+    if msgpack is None:
+        raise RuntimeError("msgpack이 설치되어 있지 않습니다")
+    return msgpack.packb(payload, use_bin_type=True)
@@ -0,0 +1,180 @@
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def make_owner_id():
+    """프로세스 식별자 (호스트:PID:난수)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class DbLease:
+    """updater_leases 테이블의 lease 행으로 리더 선출 (여러 노드 공용)
+
+    만료된 lease이거나 내 lease일 때만 UPDATE가 성공하므로 동시에 한 프로세스만 리더가 된다.
+    """
+
+    def __init__(self, app, name, lease_seconds):
+        self._app = app
+        self.name = name
+        self.lease_seconds = lease_seconds
+
+    def acquire(self, owner):
+        """lease 획득 또는 갱신 (heartbeat)"""
+        from sqlalchemy import or_
+        from sqlalchemy.exc import IntegrityError
+        from models.lease import UpdaterLease
+        from utils.db import db
+
+        with self._app.app_context():
+            now = datetime.utcnow()
+            expires_at = now + timedelta(seconds=self.lease_seconds)
+            try:
+                updated = UpdaterLease.query.filter(
+                    UpdaterLease.name == self.name,
+                    or_(UpdaterLease.owner == owner, UpdaterLease.expires_at < now)
+                ).update(
+                    {'owner': owner, 'heartbeat_at': now, 'expires_at': expires_at},
+                    synchronize_session=False
+                )
+                if updated:
+                    db.session.commit()
+                    return True
+
+                if db.session.get(UpdaterLease, self.name) is not None:
+                    # 다른 프로세스가 유효한 lease를 보유 중
+                    db.session.rollback()
+                    return False
+
+                db.session.add(UpdaterLease(
+                    name=self.name, owner=owner, heartbeat_at=now, expires_at=expires_at
+                ))
+                db.session.commit()
+                return True
+            except IntegrityError:
+                # 동시에 다른 프로세스가 먼저 생성
+                db.session.rollback()
+                return False
+            except Exception:
+                db.session.rollback()
+                raise
+
+    def release(self, owner):
+        from models.lease import UpdaterLease
+        from utils.db import db
+
+        with self._app.app_context():
+            try:
+                UpdaterLease.query.filter_by(name=self.name, owner=owner).update(
+                    {'expires_at': datetime.utcnow()}, synchronize_session=False
+                )
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logging.warning(f"리더 lease 반납 실패: {e}")
+
+
+class FileLease:
+    """로컬 파일 잠금으로 리더 선출 (단일 호스트용)
+
+    잠금은 프로세스가 파일을 열고 있는 동안 유지되며, 프로세스가 죽으면 OS가 즉시 해제한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def acquire(self, owner):
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            logging.warning("fcntl을 사용할 수 없어 파일 잠금 없이 리더로 동작합니다")
+            return True
+        fd = open(self.path, 'a+')
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            fd.close()
+            return False
+        fd.seek(0)
+        fd.truncate()
+        fd.write(owner)
+        fd.flush()
+        self._fd = fd
+        return True
+
+    def release(self, owner):
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._fd.close()
+            self._fd = None
+
+
+class LeaderElector:
+    """heartbeat 스레드로 lease를 주기적으로 획득/갱신하는 리더 선출기
+
+    heartbeat 주기는 lease 시간의 1/3이므로 리더가 죽으면 lease 만료 후 다음 heartbeat에서
+    다른 프로세스가 리더를 이어받는다.
+    """
+
+    def __init__(self, backend, heartbeat_seconds, owner=None):
+        self.backend = backend
+        self.heartbeat_seconds = heartbeat_seconds
+        self.owner = owner or make_owner_id()
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def heartbeat(self):
+        """lease 획득/갱신 1회 (DB 오류 시 리더 지위를 내려놓음)"""
+        try:
+            acquired = self.backend.acquire(self.owner)
+        except Exception as e:
+            logging.error(f"리더 lease 갱신 실패: {e}")
+            acquired = False
+
+        if acquired != self.is_leader:
+            logging.info(f"리더 {'획득' if acquired else '상실'}: {self.owner}")
+        self.is_leader = acquired
+        return acquired
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self.heartbeat()
+
+        def loop():
+            while not self._stop.wait(self.heartbeat_seconds):
+                self.heartbeat()
+
+        self._thread = threading.Thread(target=loop, daemon=True, name='leader-heartbeat')
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.is_leader:
+            self.backend.release(self.owner)
+        self.is_leader = False
+
+    def get_stats(self):
+        return {
+            'owner': self.owner,
+            'backend': type(self.backend).__name__,
+            'is_leader': self.is_leader
+        }
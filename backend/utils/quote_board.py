@@ -0,0 +1,176 @@
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+
+# 종목당 숫자 필드 (고정 폭 레코드 1개 = 80바이트)
+QUOTE_DTYPE = np.dtype([
+    ('current_price', 'f8'),
+    ('previous_close', 'f8'),
+    ('open_price', 'f8'),
+    ('high_price', 'f8'),
+    ('low_price', 'f8'),
+    ('volume', 'i8'),
+    ('change', 'f8'),
+    ('change_percent', 'f8'),
+    ('exchange_rate', 'f8'),  # NaN이면 환율 정보 없음 (원화 종목)
+    ('updated_at', 'f8'),     # epoch 초 (UTC)
+])
+
+# 시세 dict에 그대로 들어가는 숫자 필드 (응답 순서)
+PRICE_FIELDS = ('current_price', 'previous_close', 'open_price', 'high_price', 'low_price',
+                'volume', 'change', 'change_percent')
+
+
+def to_epoch(value):
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=timezone.utc).timestamp()
+    if value is None:
+        return datetime.utcnow().replace(tzinfo=timezone.utc).timestamp()
+    return float(value)
+
+
+def from_epoch(value):
+    return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+
+
+class QuoteBoard:
+    """구조화 배열 기반의 compact 시세 보드
+
+    숫자 필드는 종목별 슬롯에 고정 폭 레코드로 저장하고, 문자열 필드(name/market/currency)는
+    슬롯별 튜플로 따로 보관한다. symbol -> slot 매핑으로 조회하며, 여러 종목의 가격을
+    배열 연산으로 한 번에 읽을 수 있다.
+    """
+
+    def __init__(self, capacity=1024):
+        self.rows = np.zeros(capacity, dtype=QUOTE_DTYPE)
+        self.slots = {}    # symbol -> slot
+        self.symbols = []  # slot -> symbol
+        self.meta = []     # slot -> (name, market, currency)
+
+    def copy(self):
+        """다음 스냅샷용 사본 (배열은 memcpy 1회)"""
+        board = QuoteBoard.__new__(QuoteBoard)
+        board.rows = self.rows.copy()
+        board.slots = dict(self.slots)
+        board.symbols = list(self.symbols)
+        board.meta = list(self.meta)
+        return board
+
+    def _slot_for(self, symbol):
+        slot = self.slots.get(symbol)
+        if slot is not None:
+            return slot
+        slot = len(self.symbols)
+        if slot >= len(self.rows):
+            grown = np.zeros(max(1, len(self.rows)) * 2, dtype=QUOTE_DTYPE)
+            grown[:len(self.rows)] = self.rows
+            self.rows = grown
+        self.slots[symbol] = slot
+        self.symbols.append(symbol)
+        self.meta.append(None)
+        return slot
+
+    def set_quote(self, symbol, stock_data):
+        """시세 dict를 슬롯에 기록"""
+        slot = self._slot_for(symbol)
+        exchange_rate = stock_data.get('exchange_rate')
+        self.rows[slot] = (
+            stock_data.get('current_price') or 0,
+            stock_data.get('previous_close') or 0,
+            stock_data.get('open_price') or 0,
+            stock_data.get('high_price') or 0,
+            stock_data.get('low_price') or 0,
+            stock_data.get('volume') or 0,
+            stock_data.get('change') or 0,
+            stock_data.get('change_percent') or 0,
+            exchange_rate if exchange_rate is not None else math.nan,
+            to_epoch(stock_data.get('updated_at')),
+        )
+        market = stock_data.get('market', 'KRW')
+        self.meta[slot] = (
+            stock_data.get('name') or symbol,
+            market,
+            stock_data.get('currency', market),
+        )
+
+    def get_quote(self, symbol):
+        """슬롯의 시세를 기존과 같은 형태의 dict로 반환"""
+        slot = self.slots.get(symbol)
+        if slot is None:
+            return None
+        row = self.rows[slot]
+        name, market, currency = self.meta[slot]
+        quote = {
+            'symbol': symbol,
+            'name': name,
+            'current_price': float(row['current_price']),
+            'previous_close': float(row['previous_close']),
+            'open_price': float(row['open_price']),
+            'high_price': float(row['high_price']),
+            'low_price': float(row['low_price']),
+            'volume': int(row['volume']),
+            'change': float(row['change']),
+            'change_percent': float(row['change_percent']),
+            'market': market,
+            'currency': currency,
+            'updated_at': from_epoch(float(row['updated_at']))
+        }
+        exchange_rate = float(row['exchange_rate'])
+        if not math.isnan(exchange_rate):
+            quote['exchange_rate'] = exchange_rate
+        return quote
+
+    def get_quotes(self, symbols):
+        """여러 종목 시세 {symbol: dict} (필드별로 배열을 한 번에 변환, 보드에 없는 종목은 제외)"""
+        symbols = [symbol for symbol in symbols if symbol in self.slots]
+        if not symbols:
+            return {}
+        idx = self.slot_indices(symbols)
+        rows = self.rows[idx]
+        columns = [rows[field].tolist() for field in PRICE_FIELDS]
+        exchange_rates = rows['exchange_rate'].tolist()
+        updated_at = rows['updated_at'].tolist()
+
+        quotes = {}
+        for i, (symbol, slot) in enumerate(zip(symbols, idx.tolist())):
+            name, market, currency = self.meta[slot]
+            quote = {'symbol': symbol, 'name': name}
+            for field, column in zip(PRICE_FIELDS, columns):
+                quote[field] = column[i]
+            quote['market'] = market
+            quote['currency'] = currency
+            quote['updated_at'] = from_epoch(updated_at[i])
+            if not math.isnan(exchange_rates[i]):
+                quote['exchange_rate'] = exchange_rates[i]
+            quotes[symbol] = quote
+        return quotes
+
+    def slot_indices(self, symbols):
+        """종목 목록의 슬롯 배열 (보드에 없는 종목은 -1)"""
+        return np.fromiter((self.slots.get(s, -1) for s in symbols), dtype=np.int64, count=len(symbols))
+
+    def krw_prices(self, symbols):
+        """여러 종목의 원화 환산 현재가 배열 (없는 종목은 NaN)"""
+        idx = self.slot_indices(symbols)
+        prices = np.full(len(idx), np.nan)
+        present = idx >= 0
+        rows = self.rows[idx[present]]
+        fx = np.where(np.isnan(rows['exchange_rate']), 1.0, rows['exchange_rate'])
+        is_usd = np.fromiter((self.meta[i][2] == 'USD' for i in idx[present]), dtype=bool, count=int(present.sum()))
+        prices[present] = np.where(is_usd, rows['current_price'] * fx, rows['current_price'])
+        return prices
+
+    def __contains__(self, symbol):
+        return symbol in self.slots
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    @property
+    def nbytes(self):
+        """숫자 레코드 배열 크기 (바이트)"""
+        return self.rows.nbytes
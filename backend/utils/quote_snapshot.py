@@ -0,0 +1,136 @@
+import threading
+from datetime import datetime
+
+from utils.quote_board import QuoteBoard
+
+
+class FrozenQuote(dict):
+    """수정할 수 없는 시세 dict
+
+    dict를 상속하므로 jsonify 등에서 그대로 직렬화되며, 변경이 필요하면 copy()로
+    일반 dict 사본을 만들어 사용한다.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("시세 스냅샷은 수정할 수 없습니다 (copy() 후 수정하세요)")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def copy(self):
+        """수정 가능한 일반 dict 사본"""
+        return dict(self)
+
+    def __reduce__(self):
+        return (FrozenQuote, (dict(self),))
+
+
+def freeze_quote(stock_data):
+    """시세 dict를 FrozenQuote로 변환 (이미 변환된 경우 그대로 반환)"""
+    if stock_data is None or isinstance(stock_data, FrozenQuote):
+        return stock_data
+    return FrozenQuote(stock_data)
+
+
+class QuoteSnapshot:
+    """특정 시점의 시세 전체 (불변)
+
+    시세는 QuoteBoard(구조화 배열)에 compact하게 저장되고, 조회 시 FrozenQuote로 만들어 반환한다.
+    """
+
+    __slots__ = ('version', 'board', 'created_at')
+
+    def __init__(self, version, board, created_at=None):
+        self.version = version
+        self.board = board  # 교체 후에는 수정되지 않음
+        self.created_at = created_at or datetime.utcnow()
+
+    def get(self, symbol, default=None):
+        quote = self.board.get_quote(symbol)
+        return FrozenQuote(quote) if quote is not None else default
+
+    def get_many(self, symbols):
+        """여러 종목 조회 {symbol: FrozenQuote} (보드에서 필드별로 한 번에 읽음, 없는 종목은 제외)"""
+        return {symbol: FrozenQuote(quote) for symbol, quote in self.board.get_quotes(symbols).items()}
+
+    def __contains__(self, symbol):
+        return symbol in self.board
+
+    def __len__(self):
+        return len(self.board)
+
+
+class QuoteStore:
+    """copy-on-write 방식의 시세 저장소
+
+    쓰기는 잠금 하에 현재 보드를 복사해 새 스냅샷을 만들고 참조를 한 번에 교체한다.
+    읽기는 잠금 없이 현재 스냅샷 참조만 읽으므로 항상 일관된 시점의 값을 본다.
+    """
+
+    def __init__(self, capacity=1024):
+        self._snapshot = QuoteSnapshot(0, QuoteBoard(capacity))
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        """현재 스냅샷 (여러 종목을 같은 시점 기준으로 읽을 때 사용)"""
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def _publish(self, changes):
+        if not changes:
+            return self._snapshot
+        with self._write_lock:
+            current = self._snapshot
+            board = current.board.copy()
+            for symbol, stock_data in changes.items():
+                board.set_quote(symbol, stock_data)
+            self._snapshot = QuoteSnapshot(current.version + 1, board)
+            return self._snapshot
+
+    def update(self, changes):
+        """여러 종목을 한 번에 반영 (새 스냅샷 1개 생성)"""
+        return self._publish(dict(changes))
+
+    def __setitem__(self, symbol, stock_data):
+        self._publish({symbol: stock_data})
+
+    def __getitem__(self, symbol):
+        quote = self._snapshot.get(symbol)
+        if quote is None:
+            raise KeyError(symbol)
+        return quote
+
+    def get(self, symbol, default=None):
+        return self._snapshot.get(symbol, default)
+
+    def get_many(self, symbols):
+        """여러 종목을 같은 스냅샷 기준으로 조회 {symbol: FrozenQuote}"""
+        return self._snapshot.get_many(symbols)
+
+    def __contains__(self, symbol):
+        return symbol in self._snapshot
+
+    def __len__(self):
+        return len(self._snapshot)
+
+    def __iter__(self):
+        return iter(list(self._snapshot.board))
+
+    def get_stats(self):
+        snapshot = self._snapshot
+        return {
+            'version': snapshot.version,
+            'size': len(snapshot),
+            'board_bytes': snapshot.board.nbytes,
+            'created_at': snapshot.created_at.isoformat()
+        }
@@ -0,0 +1,64 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 기반 요청 속도 제한기 (스레드 안전)
+
+    rate: 초당 충전되는 토큰 수
+    capacity: 버킷 최대 토큰 수 (순간 허용 버스트 크기)
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def acquire(self, tokens=1, timeout=None, cancel=None):
+        """토큰을 획득할 때까지 대기
+
+        capacity보다 많이 요청하면 버킷이 가득 찰 때까지 기다린 뒤 모자란 만큼을 빚으로 남겨
+        이후 호출도 그만큼 늦춘다 (재시도 backoff를 같은 제공자의 다른 요청에도 적용).
+        timeout(초) 안에 획득하지 못하거나 대기 중 cancel(threading.Event)이 설정되면 False 반환
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        needed = min(tokens, self.capacity)
+        while True:
+            if cancel is not None and cancel.is_set():
+                return False
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return True
+                wait = (needed - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            if cancel is None:
+                time.sleep(wait)
+            elif cancel.wait(wait):
+                return False
+
+    def get_stats(self):
+        """현재 상태 (모니터링용)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'available_tokens': round(self._tokens, 3)
+            }
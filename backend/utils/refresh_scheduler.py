@@ -0,0 +1,216 @@
+import heapq
+import math
+import threading
+import time
+from collections import defaultdict
+
+
+class _Entry:
+    __slots__ = ('symbol', 'market', 'pinned', 'holders', 'views', 'viewed_at',
+                 'volatility', 'last_price', 'interval', 'next_due', 'in_flight')
+
+    def __init__(self, symbol, market, pinned=False):
+        self.symbol = symbol
+        self.market = market
+        self.pinned = pinned
+        self.holders = 0
+        self.views = 0.0       # 감쇠 조회수
+        self.viewed_at = 0.0
+        self.volatility = 0.0  # 갱신 간 가격 변동률(%)의 지수 이동 평균
+        self.last_price = None
+        self.interval = None
+        self.next_due = 0.0
+        self.in_flight = False
+
+
+class RefreshScheduler:
+    """종목별 우선순위/적응형 주기 갱신 스케줄러
+
+    점수 = 보유자 수, 최근 조회 빈도(반감기 감쇠), 변동성의 가중 합.
+    갱신 주기는 base_interval / (1 + 점수)로 점수가 높을수록 짧아지고(최소 min_interval), 같은 시점에
+    갱신할 종목이 많으면 시장별 예산 안에서 점수가 높은 종목부터 조회한다.
+    보유자/조회가 없어진 종목은 스케줄에서 빠진다 (pinned 종목 제외).
+    시장별로 힙을 따로 두므로 예산을 주지 않은 시장(장 마감)은 조회 비용 없이 대기한다.
+    """
+
+    def __init__(self, market_of, base_interval=300, min_interval=30, view_half_life=600,
+                 holder_weight=1.0, view_weight=1.0, volatility_weight=0.5):
+        self.market_of = market_of
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.view_half_life = view_half_life
+        self.holder_weight = holder_weight
+        self.view_weight = view_weight
+        self.volatility_weight = volatility_weight
+
+        self._entries = {}  # symbol -> _Entry
+        self._heaps = defaultdict(list)  # market -> [(next_due, symbol)] - 지연 삭제 방식
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.deferred = 0
+
+    def __contains__(self, symbol):
+        return symbol in self._entries
+
+    # ----- 신호 입력 -----
+    def _entry(self, symbol):
+        entry = self._entries.get(symbol)
+        if entry is None:
+            entry = _Entry(symbol, self.market_of(symbol))
+            self._entries[symbol] = entry
+            self._push(entry, time.monotonic())
+        return entry
+
+    def _push(self, entry, next_due):
+        entry.next_due = next_due
+        heapq.heappush(self._heaps[entry.market], (next_due, entry.symbol))
+
+    def pin(self, symbols):
+        """항상 갱신할 기본 종목 등록"""
+        with self._lock:
+            for symbol in symbols:
+                self._entry(symbol).pinned = True
+
+    def set_holders(self, holder_counts):
+        """종목별 보유자 수 반영 ({symbol: count}, 목록에 없는 종목은 0)"""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.holders = 0
+            for symbol, count in holder_counts.items():
+                self._entry(symbol).holders = count
+
+    def record_view(self, symbol):
+        """종목 조회 1건 반영"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entry(symbol)
+            entry.views = self._decayed_views(entry, now) + 1
+            entry.viewed_at = now
+
+    def add_views(self, counts):
+        """다른 프로세스에서 모은 조회수 반영 ({symbol: 건수})"""
+        now = time.monotonic()
+        with self._lock:
+            for symbol, count in counts.items():
+                entry = self._entry(symbol)
+                entry.views = self._decayed_views(entry, now) + count
+                entry.viewed_at = now
+
+    def track(self, symbol, age=None):
+        """갱신 대상에 추가 (age: 이미 가진 시세의 나이(초) - 주기 안이면 그만큼 늦게 조회)"""
+        with self._lock:
+            entry = self._entry(symbol)
+            if age is not None and not entry.in_flight:
+                remaining = max(0.0, self._interval(entry, time.monotonic()) - age)
+                self._push(entry, time.monotonic() + remaining)
+
+    # ----- 점수 / 주기 -----
+    def _decayed_views(self, entry, now):
+        if not entry.views:
+            return 0.0
+        return entry.views * 0.5 ** ((now - entry.viewed_at) / self.view_half_life)
+
+    def _score(self, entry, now):
+        return (
+            self.holder_weight * math.log1p(entry.holders)
+            + self.view_weight * math.log1p(self._decayed_views(entry, now))
+            + self.volatility_weight * entry.volatility
+        )
+
+    def _interval(self, entry, now):
+        return max(self.min_interval, self.base_interval / (1 + self._score(entry, now)))
+
+    def _is_active(self, entry, now):
+        return entry.pinned or entry.holders > 0 or self._decayed_views(entry, now) >= 0.05
+
+    # ----- 스케줄링 -----
+    def reschedule_market(self, market):
+        """시장의 모든 종목을 즉시 갱신 대상으로 (개장 직후 / 장 마감 후 종가 확정)"""
+        now = time.monotonic()
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.market == market and not entry.in_flight:
+                    self._push(entry, now)
+
+    def has_due(self, market, now=None):
+        """시장에 갱신 시각이 된 종목이 남아 있는지 확인"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return any(
+                e.market == market and e.next_due <= now and not e.in_flight
+                for e in self._entries.values()
+            )
+
+    def due(self, budgets, now=None):
+        """지금 갱신할 종목 목록 (budgets: {market: 최대 조회 수}, 점수 높은 순)
+
+        budgets에 없는 시장의 종목은 꺼내지 않으므로 다음에 예산이 생길 때까지 기다린다.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            ready = []
+            for market in budgets:
+                heap = self._heaps[market]
+                while heap and heap[0][0] <= now:
+                    next_due, symbol = heapq.heappop(heap)
+                    entry = self._entries.get(symbol)
+                    if entry is None or entry.in_flight or entry.next_due != next_due:
+                        continue  # 이미 다시 예약된 항목
+                    if not self._is_active(entry, now):
+                        del self._entries[symbol]
+                        continue
+                    ready.append(entry)
+
+            ready.sort(key=lambda e: self._score(e, now), reverse=True)
+            remaining = dict(budgets)
+            selected = []
+            for entry in ready:
+                if remaining.get(entry.market, 0) > 0:
+                    remaining[entry.market] -= 1
+                    entry.in_flight = True
+                    selected.append(entry.symbol)
+                else:
+                    # 예산 초과: 다음 틱에 다시 후보
+                    heapq.heappush(self._heaps[entry.market], (entry.next_due, entry.symbol))
+                    self.deferred += 1
+            self.scheduled += len(selected)
+            return selected
+
+    def complete(self, symbol, stock_data=None):
+        """갱신 결과 반영 후 다음 갱신 시각 예약 (실패 시 현재 주기 유지)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None:
+                return
+            entry.in_flight = False
+            price = stock_data.get('current_price') if stock_data else None
+            if price:
+                if entry.last_price:
+                    move = abs(price - entry.last_price) / entry.last_price * 100
+                    entry.volatility = 0.7 * entry.volatility + 0.3 * move
+                entry.last_price = price
+            entry.interval = self._interval(entry, now)
+            self._push(entry, now + entry.interval)
+
+    def get_stats(self, top=10):
+        now = time.monotonic()
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: self._score(e, now), reverse=True)
+            return {
+                'tracked': len(entries),
+                'due': sum(1 for e in entries if e.next_due <= now and not e.in_flight),
+                'scheduled': self.scheduled,
+                'deferred': self.deferred,
+                'top': [
+                    {
+                        'symbol': e.symbol,
+                        'score': round(self._score(e, now), 3),
+                        'holders': e.holders,
+                        'views': round(self._decayed_views(e, now), 2),
+                        'volatility': round(e.volatility, 3),
+                        'interval': round(e.interval or self._interval(e, now), 1)
+                    }
+                    for e in entries[:top]
+                ]
+            }
@@ -0,0 +1,168 @@
+import heapq
+from bisect import bisect_left
+
+# 한글 초성 (호환 자모)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+CHOSUNG_SET = frozenset(CHOSUNG)
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+JUNGSUNG_JONGSUNG = 588  # 중성 21 x 종성 28
+
+# 순위 (작을수록 먼저)
+RANK_SYMBOL_EXACT = 0
+RANK_NAME_EXACT = 1
+RANK_SYMBOL_PREFIX = 2
+RANK_NAME_PREFIX = 3
+RANK_CHOSUNG_PREFIX = 4
+RANK_CONTAINS = 5
+RANK_CHOSUNG_CONTAINS = 6
+
+RESULT_CACHE_SIZE = 2048  # 자동완성처럼 반복되는 짧은 질의 결과 캐시
+
+
+def normalize(text):
+    """대문자 변환 + 공백 제거"""
+    return ''.join((text or '').upper().split())
+
+
+def to_chosung(text):
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch) - HANGUL_BASE
+        chars.append(CHOSUNG[code // JUNGSUNG_JONGSUNG] if 0 <= code < HANGUL_COUNT else ch)
+    return ''.join(chars)
+
+
+def _grams(text):
+    """색인/조회용 n-gram (1글자는 unigram, 그 이상은 bigram)"""
+    if len(text) == 1:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """종목코드/종목명/초성 검색 색인
+
+    정확/접두 일치는 정렬된 키 배열에서 이진 탐색으로 범위를 찾고, 접두 일치만으로 상위 N개가
+    채워지지 않을 때만 n-gram 역색인(게시 목록 교집합)으로 부분 일치를 찾는다.
+    종목명의 초성 문자열은 별도 키/색인으로 둔다. 색인은 생성 후 수정하지 않는다.
+    """
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self._keys = []      # id -> (symbol, name, chosung) 정규화 문자열
+        self._order = []     # id -> 같은 순위 안의 정렬 기준 (이름 길이, 종목코드)
+        self._text = {}      # gram -> set(id)
+        self._chosung = {}   # gram -> set(id)
+        self._results = {}   # (query, limit) -> 결과 (색인이 불변이므로 무효화 불필요)
+
+        for doc_id, entry in enumerate(self.entries):
+            symbol = normalize(entry['symbol'])
+            name = normalize(entry['name'])
+            chosung = to_chosung(name)
+            self._keys.append((symbol, name, chosung))
+            self._order.append((len(name), symbol))
+            for gram in self._all_grams(symbol) | self._all_grams(name):
+                self._text.setdefault(gram, set()).add(doc_id)
+            if chosung != name:
+                for gram in self._all_grams(chosung):
+                    self._chosung.setdefault(gram, set()).add(doc_id)
+
+        # 접두 검색용 정렬 배열 (키, id)
+        self._sorted = [
+            self._sorted_keys(i) for i in range(3)
+        ]
+
+    def _sorted_keys(self, field):
+        pairs = sorted(
+            (keys[field], doc_id) for doc_id, keys in enumerate(self._keys)
+            if field != 2 or keys[2] != keys[1]
+        )
+        return [key for key, _ in pairs], [doc_id for _, doc_id in pairs]
+
+    def _prefix(self, field, query):
+        """field 키가 query로 시작하는 id 목록과 그중 정확히 일치하는 개수 (이진 탐색)"""
+        keys, ids = self._sorted[field]
+        start = bisect_left(keys, query)
+        end = start
+        while end < len(keys) and keys[end] == query:
+            end += 1
+        exact = end - start
+        while end < len(keys) and keys[end].startswith(query):
+            end += 1
+        return ids[start:end], exact
+
+    @staticmethod
+    def _all_grams(text):
+        # 1글자 질의도 색인으로 찾을 수 있도록 unigram과 bigram을 함께 색인
+        return set(text) | _grams(text)
+
+    @staticmethod
+    def _candidates(postings, query):
+        lists = []
+        for gram in _grams(query):
+            ids = postings.get(gram)
+            if not ids:
+                return set()
+            lists.append(ids)
+        lists.sort(key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def search(self, query, limit=20):
+        """순위순 상위 limit개 종목"""
+        query = normalize(query)
+        if not query:
+            return []
+
+        cache_key = (query, limit)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        result = self._search(query, limit)
+        if len(self._results) >= RESULT_CACHE_SIZE:
+            self._results.clear()
+        self._results[cache_key] = result
+        return list(result)
+
+    def _search(self, query, limit):
+        ranked = {}
+
+        # 정확/접두 일치 (이진 탐색 범위, 앞쪽 exact개가 정확 일치)
+        ids, exact = self._prefix(1, query)
+        for i, doc_id in enumerate(ids):
+            ranked[doc_id] = RANK_NAME_EXACT if i < exact else RANK_NAME_PREFIX
+        ids, exact = self._prefix(0, query)
+        for i, doc_id in enumerate(ids):
+            ranked[doc_id] = RANK_SYMBOL_EXACT if i < exact else RANK_SYMBOL_PREFIX
+
+        # 초성이 섞인 질의 (예: ㅅㅅㅈㅈ, 삼성ㅈ)는 초성 키에서도 찾음
+        chosung_query = None
+        if any(ch in CHOSUNG_SET for ch in query):
+            chosung_query = to_chosung(query)
+            for doc_id in self._prefix(2, chosung_query)[0]:
+                ranked.setdefault(doc_id, RANK_CHOSUNG_PREFIX)
+
+        # 부분 일치는 접두 일치보다 순위가 낮으므로 상위 limit개가 채워지지 않았을 때만 찾음
+        if len(ranked) < limit:
+            keys = self._keys
+            for doc_id in self._candidates(self._text, query):
+                if doc_id not in ranked and (query in keys[doc_id][0] or query in keys[doc_id][1]):
+                    ranked[doc_id] = RANK_CONTAINS
+            if chosung_query:
+                for doc_id in self._candidates(self._chosung, chosung_query):
+                    if doc_id not in ranked and chosung_query in keys[doc_id][2]:
+                        ranked[doc_id] = RANK_CHOSUNG_CONTAINS
+
+        order = self._order
+        best = heapq.nsmallest(limit, ranked.items(), key=lambda item: (item[1], order[item[0]]))
+        return [self.entries[doc_id] for doc_id, _ in best]
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,223 @@
+import logging
+import time as _time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+import pytz
+
+WEEKDAYS = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
+
+# KRX 휴장일 (음력 명절/대체공휴일/선거일 포함 - 매년 거래소 공지 기준으로 추가)
+KRX_HOLIDAYS = {
+    2025: [
+        '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30',
+        '2025-03-03', '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03',
+        '2025-06-06', '2025-08-15', '2025-10-03', '2025-10-06', '2025-10-07',
+        '2025-10-08', '2025-10-09', '2025-12-25', '2025-12-31',
+    ],
+    2026: [
+        '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02',
+        '2026-05-01', '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17',
+        '2026-09-24', '2026-09-25', '2026-10-05', '2026-10-09', '2026-12-25',
+        '2026-12-31',
+    ],
+    2027: [
+        '2027-01-01', '2027-02-08', '2027-02-09', '2027-03-01', '2027-05-05',
+        '2027-05-13', '2027-08-16', '2027-09-14', '2027-09-15', '2027-09-16',
+        '2027-10-04', '2027-10-11', '2027-12-27', '2027-12-31',
+    ],
+}
+
+# 표에 없는 연도에 적용하는 KRX 양력 고정 휴장일 (월, 일)
+KRX_FIXED_HOLIDAYS = [(1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25), (12, 31)]
+
+
+def _nth_weekday(year, month, weekday, n):
+    """month의 n번째 weekday (n=-1이면 마지막)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year):
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = (h + l - 7 * m + 114) % 31 + 1
+    return date(year, month, day)
+
+
+def _observed(day):
+    """토요일 휴일은 금요일, 일요일 휴일은 월요일에 휴장"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year):
+    """NYSE 휴장일 (규칙 기반 계산, 조기 폐장은 제외)"""
+    days = {
+        _nth_weekday(year, 1, 0, 3),   # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),   # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),   # Independence Day
+        _nth_weekday(year, 9, 0, 1),   # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        _observed(date(year, 12, 25)),  # Christmas Day
+    }
+    # 신정이 토요일이면 전년도 12/31에 휴장하지 않음
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_observed(new_year))
+    if year >= 2022:
+        days.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return days
+
+
+def krx_holidays(year):
+    """KRX 휴장일"""
+    if year in KRX_HOLIDAYS:
+        return {date.fromisoformat(day) for day in KRX_HOLIDAYS[year]}
+    logging.warning(f"{year}년 KRX 휴장일 표가 없어 양력 고정 휴일만 적용합니다")
+    return {date(year, month, day) for month, day in KRX_FIXED_HOLIDAYS}
+
+
+# 시장 코드별 휴장일 계산 함수
+MARKET_HOLIDAYS = {
+    'KRW': krx_holidays,
+    'USD': nyse_holidays,
+}
+
+
+def parse_trading_days(trading_days):
+    """'MON-FRI' 또는 'MON,WED,FRI' 형식을 요일 번호 집합으로 변환"""
+    days = set()
+    for part in (trading_days or 'MON-FRI').upper().split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = (WEEKDAYS.index(p.strip()) for p in part.split('-'))
+            days.update(range(start, end + 1))
+        elif part:
+            days.add(WEEKDAYS.index(part))
+    return days
+
+
+class MarketSessions:
+    """한 시장의 정렬된 개장/마감 시각 (UTC epoch 초)"""
+
+    __slots__ = ('market', 'tz', 'open_time', 'close_time', 'trading_days',
+                 'opens', 'closes', 'start', 'end')
+
+    def __init__(self, market, open_time, close_time, timezone, trading_days):
+        self.market = market
+        self.tz = pytz.timezone(timezone)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.trading_days = parse_trading_days(trading_days)
+        self.opens = []
+        self.closes = []
+        self.start = self.end = None
+
+    def build(self, start, end):
+        """start ~ end(현지 날짜) 구간의 세션 계산"""
+        holiday_fn = MARKET_HOLIDAYS.get(self.market)
+        holidays = set()
+        if holiday_fn:
+            for year in range(start.year, end.year + 1):
+                holidays |= holiday_fn(year)
+
+        opens, closes = [], []
+        day = start
+        while day <= end:
+            if day.weekday() in self.trading_days and day not in holidays:
+                # localize로 서머타임을 반영한 실제 시각 계산
+                opens.append(self.tz.localize(datetime.combine(day, self.open_time)).timestamp())
+                closes.append(self.tz.localize(datetime.combine(day, self.close_time)).timestamp())
+            day += timedelta(days=1)
+
+        self.opens, self.closes = opens, closes
+        self.start, self.end = start, end
+
+    def covers(self, ts):
+        return self.start is not None and bool(self.opens) and self.opens[0] <= ts < self.closes[-1]
+
+    def session_index(self, ts):
+        """ts 이전에 시작한 마지막 세션 번호 (-1이면 없음)"""
+        return bisect_right(self.opens, ts) - 1
+
+    def is_open(self, ts):
+        i = self.session_index(ts)
+        return i >= 0 and ts <= self.closes[i]
+
+    def next_open(self, ts):
+        i = bisect_right(self.opens, ts)
+        return self.opens[i] if i < len(self.opens) else None
+
+    def next_close(self, ts):
+        i = bisect_left(self.closes, ts)
+        return self.closes[i] if i < len(self.closes) else None
+
+
+class SessionCalendar:
+    """시장별 거래 세션 캘린더
+
+    시장 운영 시간(MarketHours)과 휴장일로 과거 days_back일 ~ 이후 days_ahead일의 개장/마감 시각을
+    미리 계산해 두고, 개장 여부와 다음 개장/마감 시각을 이진 탐색으로 답한다.
+    계산 범위를 벗어나면 해당 시장만 다시 계산한다.
+    """
+
+    def __init__(self, market_hours, days_back=7, days_ahead=400):
+        """market_hours: [{'market', 'open_time', 'close_time', 'timezone', 'trading_days'}]"""
+        self.days_back = days_back
+        self.days_ahead = days_ahead
+        self.signature = self.make_signature(market_hours)
+        self.markets = {}
+        for row in market_hours:
+            sessions = MarketSessions(row['market'], row['open_time'], row['close_time'],
+                                      row['timezone'], row['trading_days'])
+            self._build(sessions, _time.time())
+            self.markets[row['market']] = sessions
+
+    @staticmethod
+    def make_signature(market_hours):
+        """운영 시간 변경 감지용 값"""
+        return tuple(sorted(
+            (row['market'], str(row['open_time']), str(row['close_time']), row['timezone'], row['trading_days'])
+            for row in market_hours
+        ))
+
+    def _build(self, sessions, ts):
+        today = datetime.fromtimestamp(ts, sessions.tz).date()
+        sessions.build(today - timedelta(days=self.days_back), today + timedelta(days=self.days_ahead))
+
+    def sessions(self, market, ts):
+        sessions = self.markets.get(market)
+        if sessions is not None and not sessions.covers(ts):
+            self._build(sessions, ts)
+        return sessions
+
+    def is_open(self, market, ts=None):
+        ts = _time.time() if ts is None else ts
+        sessions = self.sessions(market, ts)
+        return sessions is not None and sessions.is_open(ts)
+
+    def next_open(self, market, ts=None):
+        ts = _time.time() if ts is None else ts
+        sessions = self.sessions(market, ts)
+        return sessions.next_open(ts) if sessions else None
+
+    def next_close(self, market, ts=None):
+        ts = _time.time() if ts is None else ts
+        sessions = self.sessions(market, ts)
+        return sessions.next_close(ts) if sessions else None
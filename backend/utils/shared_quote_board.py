@@ -0,0 +1,265 @@
+import logging
+import math
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from utils.quote_board import QUOTE_DTYPE, from_epoch, to_epoch
+
+# 공유 메모리 레코드: 숫자 필드 + 고정 폭 문자열 필드 (UTF-8)
+SHARED_DTYPE = np.dtype(QUOTE_DTYPE.descr + [
+    ('symbol', 'S16'),
+    ('name', 'S96'),
+    ('market', 'S4'),
+    ('currency', 'S4'),
+])
+
+# 헤더 (uint64 x 8)
+HEADER_SLOTS = 8
+HEADER_BYTES = HEADER_SLOTS * 8
+MAGIC = 0x51554F5445424431  # 'QUOTEBD1'
+H_MAGIC, H_SEQ, H_COUNT, H_CAPACITY = 0, 1, 2, 3
+
+READ_RETRIES = 1000
+ATTACH_RETRY_SECONDS = 5
+
+
+def _encode(value, size):
+    return (value or '').encode('utf-8')[:size]
+
+
+def _decode(value):
+    return value.decode('utf-8', errors='ignore')
+
+
+class SharedQuoteBoard:
+    """프로세스 간 공유 메모리 시세 보드 (단일 writer / 다중 reader)
+
+    writer(갱신 프로세스)는 시퀀스 카운터를 홀수로 올린 뒤 레코드를 쓰고 다시 짝수로 올린다.
+    reader(웹 워커)는 읽기 전후의 시퀀스가 같고 짝수일 때만 값을 채택한다 (seqlock).
+    슬롯은 추가만 되므로 reader는 새로 생긴 슬롯의 심볼만 읽어 로컬 매핑을 갱신한다.
+    """
+
+    def __init__(self, name, create=False, capacity=5000):
+        self.name = name
+        self.writable = create
+        self.capacity = capacity
+        self._shm = None
+        self._header = None
+        self._rows = None
+        self._slots = {}        # symbol -> slot (로컬 매핑)
+        self._known_count = 0
+        self._lock = threading.Lock()
+        self._last_attach_try = 0.0
+
+        if create:
+            self._create()
+        else:
+            self._try_attach()
+
+    # ----- 연결 -----
+    def _bind(self, shm, capacity):
+        self._shm = shm
+        self._header = np.ndarray((HEADER_SLOTS,), dtype=np.uint64, buffer=shm.buf)
+        self._rows = np.ndarray((capacity,), dtype=SHARED_DTYPE, buffer=shm.buf, offset=HEADER_BYTES)
+        self.capacity = capacity
+
+    def _create(self):
+        size = HEADER_BYTES + SHARED_DTYPE.itemsize * self.capacity
+        try:
+            shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+            self._bind(shm, self.capacity)
+            self._header[:] = 0
+            self._header[H_CAPACITY] = self.capacity
+            self._header[H_MAGIC] = MAGIC
+            logging.info(f"공유 시세 보드 생성: {self.name} ({self.capacity}슬롯, {size:,}바이트)")
+        except FileExistsError:
+            # 이전 writer가 남긴 보드는 그대로 이어서 사용
+            if not self._try_attach(force=True):
+                raise
+            self._sync_slots()
+            logging.info(f"기존 공유 시세 보드 재사용: {self.name}")
+
+    def _try_attach(self, force=False):
+        """공유 메모리에 연결 (writer가 아직 만들지 않았으면 잠시 후 재시도)"""
+        if self._shm is not None:
+            return True
+        now = time.monotonic()
+        if not force and now - self._last_attach_try < ATTACH_RETRY_SECONDS:
+            return False
+        self._last_attach_try = now
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return False
+        self._untrack(shm)
+        header = np.ndarray((HEADER_SLOTS,), dtype=np.uint64, buffer=shm.buf)
+        if int(header[H_MAGIC]) != MAGIC:
+            del header
+            shm.close()
+            return False
+        capacity = int(header[H_CAPACITY])
+        del header
+        self._bind(shm, capacity)
+        logging.info(f"공유 시세 보드 연결: {self.name} ({capacity}슬롯)")
+        return True
+
+    @staticmethod
+    def _untrack(shm):
+        # 연결만 한 프로세스가 종료될 때 resource_tracker가 공유 메모리를 지우지 않도록 해제
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+
+    @property
+    def attached(self):
+        return self._shm is not None or self._try_attach()
+
+    # ----- 쓰기 (writer 전용) -----
+    def _slot_for(self, symbol):
+        slot = self._slots.get(symbol)
+        if slot is not None:
+            return slot
+        count = int(self._header[H_COUNT])
+        if count >= self.capacity:
+            return None
+        self._rows['symbol'][count] = _encode(symbol, 16)
+        self._header[H_COUNT] = count + 1  # 심볼 기록 후 개수 증가
+        self._slots[symbol] = count
+        self._known_count = count + 1
+        return count
+
+    def write_many(self, quotes):
+        """여러 종목 시세를 한 번의 시퀀스 구간 안에서 기록"""
+        if not self.writable:
+            raise RuntimeError("읽기 전용 공유 시세 보드입니다")
+        with self._lock:
+            header = self._header
+            header[H_SEQ] += 1  # 홀수: 쓰는 중
+            try:
+                for symbol, stock_data in quotes.items():
+                    slot = self._slot_for(symbol)
+                    if slot is None:
+                        logging.warning(f"공유 시세 보드 용량 초과: {symbol} 기록 생략")
+                        continue
+                    self._write_row(slot, symbol, stock_data)
+            finally:
+                header[H_SEQ] += 1  # 짝수: 쓰기 완료
+
+    def _write_row(self, slot, symbol, stock_data):
+        rows = self._rows
+        exchange_rate = stock_data.get('exchange_rate')
+        market = stock_data.get('market', 'KRW')
+        rows[slot] = (
+            stock_data.get('current_price') or 0,
+            stock_data.get('previous_close') or 0,
+            stock_data.get('open_price') or 0,
+            stock_data.get('high_price') or 0,
+            stock_data.get('low_price') or 0,
+            stock_data.get('volume') or 0,
+            stock_data.get('change') or 0,
+            stock_data.get('change_percent') or 0,
+            exchange_rate if exchange_rate is not None else math.nan,
+            to_epoch(stock_data.get('updated_at')),
+            _encode(symbol, 16),
+            _encode(stock_data.get('name'), 96),
+            _encode(market, 4),
+            _encode(stock_data.get('currency', market), 4),
+        )
+
+    # ----- 읽기 -----
+    def _sync_slots(self):
+        """writer가 새로 추가한 슬롯의 심볼을 로컬 매핑에 반영"""
+        count = int(self._header[H_COUNT])
+        if count > self._known_count:
+            for slot in range(self._known_count, count):
+                self._slots[_decode(self._rows['symbol'][slot])] = slot
+            self._known_count = count
+
+    def _read_consistent(self, slots):
+        """seqlock으로 일관된 레코드 사본 읽기 (실패 시 None)"""
+        header = self._header
+        for _ in range(READ_RETRIES):
+            seq = int(header[H_SEQ])
+            if seq & 1:
+                time.sleep(0)
+                continue
+            rows = self._rows[slots].copy()
+            if int(header[H_SEQ]) == seq:
+                return rows
+        return None
+
+    def get_quote(self, symbol):
+        quotes = self.get_many([symbol])
+        return quotes.get(symbol)
+
+    def get_many(self, symbols):
+        """여러 종목 시세 {symbol: dict} (보드에 없는 종목은 제외)"""
+        if not self.attached:
+            return {}
+        with self._lock:
+            self._sync_slots()
+            found = [(symbol, self._slots[symbol]) for symbol in symbols if symbol in self._slots]
+        if not found:
+            return {}
+        rows = self._read_consistent(np.array([slot for _, slot in found], dtype=np.int64))
+        if rows is None:
+            logging.warning("공유 시세 보드 읽기 재시도 초과")
+            return {}
+        return {symbol: self._row_to_quote(symbol, row) for (symbol, _), row in zip(found, rows)}
+
+    def __contains__(self, symbol):
+        if not self.attached:
+            return False
+        with self._lock:
+            self._sync_slots()
+            return symbol in self._slots
+
+    @staticmethod
+    def _row_to_quote(symbol, row):
+        quote = {
+            'symbol': symbol,
+            'name': _decode(row['name']) or symbol,
+            'current_price': float(row['current_price']),
+            'previous_close': float(row['previous_close']),
+            'open_price': float(row['open_price']),
+            'high_price': float(row['high_price']),
+            'low_price': float(row['low_price']),
+            'volume': int(row['volume']),
+            'change': float(row['change']),
+            'change_percent': float(row['change_percent']),
+            'market': _decode(row['market']),
+            'currency': _decode(row['currency']),
+            'updated_at': from_epoch(float(row['updated_at']))
+        }
+        exchange_rate = float(row['exchange_rate'])
+        if not math.isnan(exchange_rate):
+            quote['exchange_rate'] = exchange_rate
+        return quote
+
+    def get_stats(self):
+        if not self.attached:
+            return {'name': self.name, 'attached': False}
+        return {
+            'name': self.name,
+            'attached': True,
+            'writable': self.writable,
+            'capacity': self.capacity,
+            'size': int(self._header[H_COUNT]),
+            'sequence': int(self._header[H_SEQ])
+        }
+
+    def close(self, unlink=False):
+        """공유 메모리 연결 해제 (writer는 unlink=True로 삭제 가능)"""
+        if self._shm is None:
+            return
+        self._header = None
+        self._rows = None
+        shm, self._shm = self._shm, None
+        shm.close()
+        if unlink and self.writable:
+            shm.unlink()
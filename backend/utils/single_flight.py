@@ -0,0 +1,69 @@
+import threading
+
+
+class _Call:
+    """진행 중인 조회 1건"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 조회를 하나로 합치는 헬퍼
+
+    첫 번째 호출자만 실제 함수를 실행하고, 그동안 들어온 같은 키의 호출자는
+    그 결과(또는 예외)를 그대로 공유한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.issued = 0     # 실제로 실행된 조회 수
+        self.coalesced = 0  # 진행 중인 조회에 합류한 호출 수
+
+    def do(self, key, fn, timeout=None):
+        """key에 대한 fn() 결과 반환 (동시 호출은 한 번만 실행)
+
+        timeout(초)이 지나도록 선행 조회가 끝나지 않으면 합류한 호출자는 None을 받음
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.issued += 1
+                leader = True
+
+        if not leader:
+            if not call.done.wait(timeout):
+                return None
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def get_stats(self):
+        """조회 통계 (모니터링용)"""
+        with self._lock:
+            return {
+                'issued': self.issued,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls)
+            }
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """크기 제한 LRU + 신선도 TTL 캐시 (스레드 안전)
+
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    ttl(초)이 지난 항목은 조회 시 miss로 처리한다.
+    sizeof(value -> 바이트)를 주면 max_bytes도 넘지 않도록 제거한다 (max_bytes보다 큰 값은 저장하지 않음).
+    """
+
+    def __init__(self, max_entries=1000, ttl=60, max_bytes=None, sizeof=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self._data = OrderedDict()  # key -> (value, stored_at)
+        self._sizes = {}  # key -> 바이트 (sizeof를 준 경우)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """신선한 값이면 반환, 없거나 만료됐으면 None"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, stored_at = entry
+            if time.time() - stored_at > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key):
+        """만료 여부와 관계없이 (value, stored_at) 반환 (통계/LRU 순서에 영향 없음)"""
+        with self._lock:
+            return self._data.get(key)
+
+    def _remove(self, key):
+        entry = self._data.pop(key, None)
+        self.nbytes -= self._sizes.pop(key, 0)
+        return entry
+
+    def set(self, key, value, stored_at=None):
+        """값 저장 (stored_at: 값이 만들어진 시각, epoch 초)"""
+        size = self.sizeof(value) if self.sizeof else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes and size > self.max_bytes:
+                return
+            self._data[key] = (value, stored_at if stored_at is not None else time.time())
+            if size:
+                self._sizes[key] = size
+                self.nbytes += size
+            while len(self._data) > self.max_entries or (self.max_bytes and self.nbytes > self.max_bytes):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._remove(key)
+            return entry[0] if entry else default
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get_stats(self):
+        """캐시 통계 (모니터링용)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'size': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+            if self.sizeof:
+                stats['bytes'] = self.nbytes
+                stats['max_bytes'] = self.max_bytes
+            return stats